@@ -0,0 +1,383 @@
+# asset_pack.py
+# Pacote binário com as imagens já decodificadas e redimensionadas.
+#
+# Formato do arquivo:
+#   MAGIC (4 bytes) | versão (uint32) | tamanho do manifesto (uint32)
+#   manifesto (JSON utf-8) | pixels crus de todas as páginas, em sequência
+#
+# Cada página é um atlas com vários frames (animações de um mesmo personagem) ou
+# uma imagem avulsa. O manifesto guarda, para cada frame, a página e o retângulo.
+import os
+import json
+import hashlib
+import struct
+import pygame
+import atlas
+from config import IMG_DIR, PACK_PATH, ATLAS_MAX_SIZE
+
+MAGIC = b'HFPK'
+PACK_VERSION = 3
+_HEADER = struct.Struct('<4sII')
+
+
+def _spec_signature(spec):
+    """
+    Converte a especificação dos assets para a forma que fica gravada no manifesto.
+
+    Recebe:
+        spec (dict): chave -> (é lista, [(arquivo, usa alpha, tamanho), ...])
+
+    Retorna:
+        dict: mesma informação só com listas (compatível com JSON).
+    """
+    return json.loads(json.dumps(spec))
+
+
+def _hash_file(full_path):
+    """
+    Calcula o hash do conteúdo de um arquivo.
+
+    Recebe:
+        full_path (str): caminho do arquivo.
+
+    Retorna:
+        str: hash hexadecimal (blake2b de 128 bits).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(full_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _spec_sources(spec):
+    """
+    Lista os arquivos de origem usados pela especificação, sem repetir.
+
+    Recebe:
+        spec (dict): especificação dos assets.
+
+    Retorna:
+        list: arquivos relativos a IMG_DIR.
+    """
+    seen = {}
+    for _, sources in spec.values():
+        for rel, _, _ in sources:
+            seen[rel] = True
+    return list(seen)
+
+
+def source_info(spec, previous=None):
+    """
+    Lê tamanho, mtime e hash de cada arquivo de origem da especificação.
+
+    O que faz:
+        - Se o tamanho e o mtime baterem com o manifesto anterior, reaproveita o hash
+          gravado (não relê o arquivo).
+        - Caso contrário, calcula o hash do conteúdo.
+
+    Recebe:
+        spec (dict): especificação dos assets.
+        previous (dict ou None): campo 'sources' de um manifesto anterior.
+
+    Retorna:
+        dict: arquivo -> {'size', 'mtime', 'hash'}
+    """
+    previous = previous or {}
+    info = {}
+    for rel in _spec_sources(spec):
+        full = os.path.join(IMG_DIR, rel)
+        st = os.stat(full)
+        old = previous.get(rel)
+        if old and old['size'] == st.st_size and old['mtime'] == st.st_mtime_ns:
+            digest = old['hash']
+        else:
+            digest = _hash_file(full)
+        info[rel] = {'size': st.st_size, 'mtime': st.st_mtime_ns, 'hash': digest}
+    return info
+
+
+def _frame_key(rel, fmt, target):
+    # identifica um frame pelo arquivo de origem, formato e tamanho pedido
+    return (rel, fmt, tuple(target) if target else None)
+
+
+def _read_page(f, data_start, page, convert):
+    """
+    Lê uma página do pacote e cria a superfície com pygame.image.frombuffer.
+
+    Recebe:
+        f (file): pacote aberto em modo binário.
+        data_start (int): offset onde começam os pixels.
+        page (dict): dados da página no manifesto.
+        convert (bool): se True, converte para o formato da tela.
+
+    Retorna:
+        pygame.Surface ou None: None se os pixels da página estiverem incompletos
+                                (pacote cortado ou trocado depois de aberto).
+    """
+    f.seek(data_start + page['offset'])
+    data = f.read(page['length'])
+    if len(data) != page['length']:
+        return None
+    img = pygame.image.frombuffer(data, tuple(page['size']), page['format'])
+    if convert:
+        img = img.convert_alpha() if page['format'] == 'RGBA' else img.convert()
+    return img
+
+
+def write_pack(spec, decode, path=PACK_PATH, groups=None, max_size=ATLAS_MAX_SIZE):
+    """
+    Grava o pacote, decodificando só as imagens cujo arquivo de origem mudou.
+
+    O que faz:
+        - Lê o manifesto do pacote anterior (se houver).
+        - Para cada frame, se o hash do arquivo de origem não mudou, recorta os pixels
+          crus do pacote anterior; senão chama decode() para gerar a superfície.
+        - Junta os frames de cada grupo em páginas de atlas; chaves fora de grupos
+          viram uma página por imagem.
+        - Grava o novo pacote num arquivo temporário e troca pelo antigo.
+
+    Recebe:
+        spec (dict): especificação dos assets.
+        decode (callable): decode(arquivo, tamanho) -> pygame.Surface não convertida.
+        path (str): caminho do pacote.
+        groups (dict ou None): nome do grupo -> chaves cujos frames dividem o atlas.
+        max_size (int): lado máximo de uma página de atlas.
+
+    Retorna:
+        tuple: (tamanho do pacote em bytes, quantidade de frames decodificados)
+    """
+    old_manifest, old_start = read_manifest(path)
+    old_sources = old_manifest['sources'] if old_manifest else {}
+    sources = source_info(spec, old_sources)
+
+    old_frames = {}
+    if old_manifest:
+        for frames in old_manifest['entries'].values():
+            for fr in frames:
+                rel = fr['source']
+                if rel in old_sources and rel in sources and old_sources[rel]['hash'] == sources[rel]['hash']:
+                    old_frames[_frame_key(rel, fr['format'], fr['target'])] = fr
+
+    # 1. obtém cada frame (do pacote anterior ou decodificando)
+    surfaces = {}
+    decoded = 0
+    old_pages = {}
+    old_file = open(path, 'rb') if old_frames else None
+    try:
+        for key, (_, spec_sources) in spec.items():
+            surfaces[key] = []
+            for rel, alpha, target in spec_sources:
+                fmt = 'RGBA' if alpha else 'RGB'
+                old = old_frames.get(_frame_key(rel, fmt, target))
+                if old is not None and old['page'] not in old_pages:
+                    old_pages[old['page']] = _read_page(old_file, old_start, old_manifest['pages'][old['page']], False)
+                if old is not None and old_pages[old['page']] is not None:
+                    surf = atlas.frame_from_page(old_pages[old['page']], old['rect'])
+                else:
+                    # arquivo mudou, ou a página antiga está incompleta: decodifica de novo
+                    surf = decode(rel, target)
+                    decoded += 1
+                surfaces[key].append(surf)
+    finally:
+        if old_file is not None:
+            old_file.close()
+
+    # 2. monta as páginas: um atlas por grupo, uma página por imagem avulsa
+    pages = []
+    entries = {key: [None] * len(spec[key][1]) for key in spec}
+    grouped = set()
+    for group_keys in (groups or {}).values():
+        members = [(key, i) for key in group_keys if key in spec for i in range(len(spec[key][1]))
+                   if spec[key][1][i][1]]
+        grouped.update(members)
+        group_pages, placed = atlas.build_pages([surfaces[k][i] for k, i in members], max_size)
+        first = len(pages)
+        pages.extend((p, 'RGBA') for p in group_pages)
+        for (key, i), (page, rect) in zip(members, placed):
+            entries[key][i] = (first + page, list(rect))
+    for key, (_, spec_sources) in spec.items():
+        for i, (_, alpha, _) in enumerate(spec_sources):
+            if (key, i) not in grouped:
+                surf = surfaces[key][i]
+                pages.append((surf, 'RGBA' if alpha else 'RGB'))
+                entries[key][i] = (len(pages) - 1, [0, 0, surf.get_width(), surf.get_height()])
+
+    # 3. serializa as páginas e o manifesto
+    blobs = []
+    page_meta = []
+    offset = 0
+    for surf, fmt in pages:
+        data = pygame.image.tobytes(surf, fmt)
+        page_meta.append({'offset': offset, 'length': len(data), 'size': list(surf.get_size()), 'format': fmt})
+        blobs.append(data)
+        offset += len(data)
+
+    manifest = {
+        'spec': _spec_signature(spec),
+        'sources': sources,
+        'pages': page_meta,
+        'entries': {
+            key: [{'source': rel, 'target': list(target) if target else None,
+                   'format': 'RGBA' if alpha else 'RGB', 'page': page, 'rect': rect}
+                  for (rel, alpha, target), (page, rect) in zip(spec[key][1], entries[key])]
+            for key in spec
+        },
+    }
+    raw_manifest = json.dumps(manifest).encode('utf-8')
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as out:
+        out.write(_HEADER.pack(MAGIC, PACK_VERSION, len(raw_manifest)))
+        out.write(raw_manifest)
+        for data in blobs:
+            out.write(data)
+    os.replace(tmp_path, path)
+    return _HEADER.size + len(raw_manifest) + offset, decoded
+
+
+def read_manifest(path=PACK_PATH):
+    """
+    Lê apenas o cabeçalho e o manifesto do pacote.
+
+    Recebe:
+        path (str): caminho do pacote.
+
+    Retorna:
+        tuple: (manifesto, offset onde começam os pixels) ou (None, 0) se o pacote
+               não existir, for de outra versão, tiver o manifesto corrompido ou
+               o tamanho do arquivo não bater com o das páginas.
+    """
+    if not os.path.isfile(path):
+        return None, 0
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return None, 0
+        magic, version, manifest_len = _HEADER.unpack(header)
+        if magic != MAGIC or version != PACK_VERSION:
+            return None, 0
+        try:
+            manifest = json.loads(f.read(manifest_len).decode('utf-8'))
+        except ValueError:
+            # manifesto truncado ou danificado: o pacote é refeito como se fosse de outra versão
+            return None, 0
+    data_start = _HEADER.size + manifest_len
+    try:
+        expected = data_start + sum(page['length'] for page in manifest['pages'])
+    except (KeyError, TypeError):
+        return None, 0
+    if os.path.getsize(path) != expected:
+        # pixels cortados (ou sobrando): o pacote é refeito como se fosse de outra versão
+        return None, 0
+    return manifest, data_start
+
+
+def is_fresh(manifest, spec):
+    """
+    Verifica se o pacote corresponde à especificação e aos arquivos atuais.
+
+    O que faz:
+        - Compara a especificação gravada com a atual.
+        - Compara o hash de cada arquivo de origem; só relê o arquivo quando o
+          tamanho ou o mtime mudaram (um simples "touch" não invalida o pacote).
+
+    Recebe:
+        manifest (dict): manifesto lido do pacote.
+        spec (dict): especificação atual dos assets.
+
+    Retorna:
+        bool: True se nenhum arquivo de origem mudou desde o bake.
+    """
+    if manifest is None or manifest.get('spec') != _spec_signature(spec):
+        return False
+    old_sources = manifest.get('sources', {})
+    try:
+        current = source_info(spec, old_sources)
+    except OSError:
+        return False
+    return all(old_sources.get(rel, {}).get('hash') == info['hash'] for rel, info in current.items())
+
+
+def open_pack(spec, path=PACK_PATH):
+    """
+    Abre o pacote e confere se ele está atualizado, sem ler os pixels.
+
+    Recebe:
+        spec (dict): especificação atual dos assets.
+        path (str): caminho do pacote.
+
+    Retorna:
+        tuple ou None: (manifesto, offset onde começam os pixels), ou None se o
+                       pacote não existir ou estiver desatualizado.
+    """
+    manifest, data_start = read_manifest(path)
+    if not is_fresh(manifest, spec):
+        return None
+    return manifest, data_start
+
+
+def read_entries(opened, keys, path=PACK_PATH, convert=True, page_cache=None):
+    """
+    Lê só as entradas pedidas de um pacote já aberto com open_pack().
+
+    O que faz:
+        - Lê cada página necessária uma única vez (seek + read) e cria a superfície
+          com pygame.image.frombuffer; se pedido, converte para o formato da tela.
+        - Cada frame vira uma subsuperfície da sua página de atlas (os pixels não
+          são copiados).
+
+    Recebe:
+        opened (tuple): retorno de open_pack().
+        keys (iterable): chaves a carregar.
+        path (str): caminho do pacote.
+        convert (bool): False para devolver as superfícies sem converter (permite
+                        ler o pacote numa thread de trabalho).
+        page_cache (dict ou None): páginas já lidas (índice -> superfície), para
+                                   reaproveitar entre chamadas.
+
+    Retorna:
+        dict ou None: chave -> lista de pygame.Surface, ou None se alguma página
+                      estiver incompleta (o pacote deve ser tratado como desatualizado).
+    """
+    manifest, data_start = opened
+    pages = page_cache if page_cache is not None else {}
+    loaded = {}
+    with open(path, 'rb') as f:
+        for key in keys:
+            surfs = []
+            for fr in manifest['entries'][key]:
+                page = pages.get(fr['page'])
+                if page is None:
+                    page = _read_page(f, data_start, manifest['pages'][fr['page']], convert)
+                    if page is None:
+                        return None
+                    pages[fr['page']] = page
+                surfs.append(atlas.frame_from_page(page, fr['rect']))
+            loaded[key] = surfs
+    return loaded
+
+
+def read_pack(spec, path=PACK_PATH):
+    """
+    Carrega todas as superfícies do pacote, se ele estiver atualizado.
+
+    Recebe:
+        spec (dict): especificação atual dos assets.
+        path (str): caminho do pacote.
+
+    Retorna:
+        dict ou None: chave -> lista de pygame.Surface convertidas, ou None se o
+                      pacote não existir ou estiver desatualizado.
+    """
+    opened = open_pack(spec, path)
+    if opened is None:
+        return None
+    return read_entries(opened, spec.keys(), path)
+
+
+if __name__ == '__main__':
+    from assets import bake_pack
+    size, decoded = bake_pack()
+    print(f"Pacote gerado em {PACK_PATH} ({size / (1024 * 1024):.1f} MB, {decoded} imagens decodificadas)")
@@ -1,215 +1,825 @@
 # assets.py
 import os
 import re
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import pygame
-from config import IMG_DIR, SND_DIR, LARGURA, ALTURA  # IMG_DIR = "assets/imagens"
+import asset_pack
+import atlas
+from surfaces import prepare_frames, prepare_surface
+from config import IMG_DIR, SND_DIR, LARGURA, ALTURA, PACK_PATH, ASSET_LOAD_WORKERS, ASSET_CACHE_BUDGET, ASSET_DISPLAY_SIZES_ONLY  # IMG_DIR = "assets/imagens"
 
 DANTE_WALK = 'dante_walk'
+DANTE_DIE = 'dante_die'
+DANTE_HURT = 'dante_hurt'
+DANTE_ATTACK = 'dante_attack'
+
+IRA_IDLE = 'ira_idle'
+IRA_ATTACK = 'ira_attack'
+IRA_DIE = 'ira_die'
+
+GULA_IDLE = 'gula_idle'
+GULA_WALK = 'gula_walk'
+GULA_ATTACK = 'gula_attack'
+GULA_DIE = 'gula_die'
+GULA_COXA = 'gula_coxa'
+
+GANANCIA_IDLE = 'ganancia_idle'
+GANANCIA_WALK = 'ganancia_walk'
+GANANCIA_ATTACK = 'ganancia_attack'
+GANANCIA_DIE = 'ganancia_die'
+
+MENU_BACK = 'menu_back'
+COMMAND_SCR = 'command_scr'
+GAME_OVER_BACK = 'game_over_back'
+ICON = 'icon'
+GAME_ICON = 'game_icon'
+
+ATK_SOUND = 'atk_sound'
+HURT_SOUND = 'hurt_sound'
+
+# Animações: chave -> pasta dentro de IMG_DIR (frames ordenados pelo número no nome)
+ANIMATION_FOLDERS = {
+    DANTE_WALK: 'andando',
+    DANTE_DIE: 'morrendo',
+    DANTE_HURT: 'dano',
+    DANTE_ATTACK: 'atacando',
+    IRA_ATTACK: 'ira_ataque',
+    IRA_DIE: 'ira_morte',
+    GULA_IDLE: 'gula_parado',
+    GULA_WALK: 'gula_andando',
+    GULA_ATTACK: 'gula_ataque',
+    GULA_DIE: 'gula_morrendo',
+    GANANCIA_IDLE: 'ganancia_parado',
+    GANANCIA_WALK: 'ganancia_andando',
+    GANANCIA_ATTACK: 'ganancia_ataque',
+    GANANCIA_DIE: 'ganancia_morrendo',
+}
+
+# Imagens avulsas: chave -> (arquivo dentro de IMG_DIR, usa alpha, tamanho final ou None)
+IMAGE_FILES = {
+    IRA_IDLE: ('ira_parado.png', True, None),
+    MENU_BACK: ('menu_hell.jpg', False, (LARGURA, ALTURA)),
+    COMMAND_SCR: ('Gemini_Generated_Image_4trti34trti34trt.png', False, (LARGURA, ALTURA)),
+    GAME_OVER_BACK: ('game_over_back.jpg', False, (LARGURA, ALTURA)),
+    ICON: ('Gemini_Generated_Image_8p5c2s8p5c2s8p5c.png', True, None),
+    GAME_ICON: ('Gemini_Generated_Image_8p5c2s8p5c2s8p5c.png', True, (32, 32)),
+}
+
+COXA_FOLDER = 'coxa_de_frango'
+
+# Imagens em tamanho original que o jogo não desenha direto (só entram no modo com
+# ASSET_DISPLAY_SIZES_ONLY = False)
+SOURCE_ONLY_IMAGES = (ICON,)
+
+# Tamanho em que cada imagem aparece na tela, quando ele é fixo (coxa = gula.COXA_WIDTH x COXA_HEIGHT)
+DISPLAY_SIZES = {GULA_COXA: (40, 20)}
+
+# Conjuntos de animação de cada boss: só são carregados quando a sala do boss precisa
+GULA_ASSETS = (GULA_IDLE, GULA_WALK, GULA_ATTACK, GULA_DIE, GULA_COXA)
+GANANCIA_ASSETS = (GANANCIA_IDLE, GANANCIA_WALK, GANANCIA_ATTACK, GANANCIA_DIE)
+IRA_ASSETS = (IRA_IDLE, IRA_ATTACK, IRA_DIE)
+LAZY_ASSETS = GULA_ASSETS + GANANCIA_ASSETS + IRA_ASSETS
+DANTE_ASSETS = (DANTE_WALK, DANTE_DIE, DANTE_HURT, DANTE_ATTACK)
+
+# Personagens cujos frames dividem as mesmas páginas de atlas no pacote
+ATLAS_GROUPS = {
+    'dante': DANTE_ASSETS,
+    'gula': GULA_ASSETS,
+    'ganancia': GANANCIA_ASSETS,
+    'ira': IRA_ASSETS,
+}
+
+# Lado para onde cada sprite olha no arquivo original (1 = direita, -1 = esquerda)
+NATIVE_FACING = {key: -1 for key in GULA_ASSETS}
 
 def _numeric_sort_key(name):
     # pega último número no filename (Dante_andando.3.png -> 3)
     m = re.search(r'(\d+)(?=\D*$)', name)
     return int(m.group(1)) if m else 0
 
-def load_assets():
-    assets = {}
-    folder = os.path.join(IMG_DIR, "andando")  # pasta onde você colocou os 8 frames
-
-    files = [f for f in os.listdir(folder) if f.lower().endswith(".png")]
-    files = sorted(files, key=_numeric_sort_key)
-
-    frames = []
-    for fn in files:
-        path = os.path.join(folder, fn)
-        img = pygame.image.load(path).convert_alpha()
-        frames.append(img)
-    assets[DANTE_WALK] = frames
-
-    DANTE_DIE = 'dante_die'
-    morrendo_folder = os.path.join(IMG_DIR, "morrendo")
-    die_frames = []
-    if os.path.isdir(morrendo_folder):
-        die_files = [f for f in os.listdir(morrendo_folder) if f.lower().endswith(".png")]
-        die_files = sorted(die_files, key=_numeric_sort_key)
-        for fn in die_files:
-            path = os.path.join(morrendo_folder, fn)
-            die_frames.append(pygame.image.load(path).convert_alpha())
-    assets[DANTE_DIE] = die_frames
-
-    DANTE_HURT = 'dante_hurt'
-    hurt_folder = os.path.join(IMG_DIR, "dano")
-    hurt_frames = []
-    if os.path.isdir(hurt_folder):
-        hurt_files = [f for f in os.listdir(hurt_folder) if f.lower().endswith(".png")]
-        # ordena por número no nome (Dante_hurt.1.png ...)
-        hurt_files = sorted(hurt_files, key=_numeric_sort_key)
-        for fn in hurt_files:
-            hurt_frames.append(pygame.image.load(os.path.join(hurt_folder, fn)).convert_alpha())
-    assets[DANTE_HURT] = hurt_frames
-
-    DANTE_ATTACK = 'dante_attack'
-    attack_folder = os.path.join(IMG_DIR, "atacando")
-    attack_frames = []
-    if os.path.isdir(attack_folder):
-        afiles = [f for f in os.listdir(attack_folder) if f.lower().endswith(".png")]
-        afiles = sorted(afiles, key=_numeric_sort_key)
-        for fn in afiles:
-            attack_frames.append(pygame.image.load(os.path.join(attack_folder, fn)).convert_alpha())
-    assets[DANTE_ATTACK] = attack_frames
-
-    IRA_IDLE = 'ira_idle'
-    ira_idle_path = os.path.join(IMG_DIR, "ira_parado.png")
-    ira_idle = None
-    if os.path.isfile(ira_idle_path):
-        ira_idle = pygame.image.load(ira_idle_path).convert_alpha()
-    assets[IRA_IDLE] = ira_idle
-
-    IRA_ATTACK = 'ira_attack'
-    ira_attack_folder = os.path.join(IMG_DIR, "ira_ataque")
-    ira_attack_frames = []
-    if os.path.isdir(ira_attack_folder):
-        files = [f for f in os.listdir(ira_attack_folder) if f.lower().endswith(".png")]
-        files = sorted(files, key=_numeric_sort_key)
-        for fn in files:
-            ira_attack_frames.append(pygame.image.load(os.path.join(ira_attack_folder, fn)).convert_alpha())
-    assets[IRA_ATTACK] = ira_attack_frames
-
-    IRA_DIE = 'ira_die'
-    ira_die_folder = os.path.join(IMG_DIR, "ira_morte")
-    ira_die_frames = []
-    if os.path.isdir(ira_die_folder):
-        files = [f for f in os.listdir(ira_die_folder) if f.lower().endswith(".png")]
-        files = sorted(files, key=_numeric_sort_key)
-        for fn in files:
-            ira_die_frames.append(pygame.image.load(os.path.join(ira_die_folder, fn)).convert_alpha())
-    assets[IRA_DIE] = ira_die_frames
-
-        # GULA
-    GULA_IDLE = 'gula_idle'
-    gula_idle_folder = os.path.join(IMG_DIR, "gula_parado")
-    gula_idle_frames = []
-    if os.path.isdir(gula_idle_folder):
-        files = [f for f in os.listdir(gula_idle_folder) if f.lower().endswith(".png")]
-        files = sorted(files, key=_numeric_sort_key)
-        for fn in files:
-            gula_idle_frames.append(pygame.image.load(os.path.join(gula_idle_folder, fn)).convert_alpha())
-    assets[GULA_IDLE] = gula_idle_frames
-
-    GULA_WALK = 'gula_walk'
-    gula_walk_folder = os.path.join(IMG_DIR, "gula_andando")
-    gula_walk_frames = []
-    if os.path.isdir(gula_walk_folder):
-        files = [f for f in os.listdir(gula_walk_folder) if f.lower().endswith(".png")]
-        files = sorted(files, key=_numeric_sort_key)
-        for fn in files:
-            gula_walk_frames.append(pygame.image.load(os.path.join(gula_walk_folder, fn)).convert_alpha())
-    assets[GULA_WALK] = gula_walk_frames
-
-    GULA_ATTACK = 'gula_attack'
-    gula_attack_folder = os.path.join(IMG_DIR, "gula_ataque")
-    gula_attack_frames = []
-    if os.path.isdir(gula_attack_folder):
-        files = [f for f in os.listdir(gula_attack_folder) if f.lower().endswith(".png")]
-        files = sorted(files, key=_numeric_sort_key)
-        for fn in files:
-            gula_attack_frames.append(pygame.image.load(os.path.join(gula_attack_folder, fn)).convert_alpha())
-    assets[GULA_ATTACK] = gula_attack_frames
-
-    GULA_DIE = 'gula_die'
-    gula_die_folder = os.path.join(IMG_DIR, "gula_morrendo")
-    gula_die_frames = []
-    if os.path.isdir(gula_die_folder):
-        files = [f for f in os.listdir(gula_die_folder) if f.lower().endswith(".png")]
-        files = sorted(files, key=_numeric_sort_key)
-        for fn in files:
-            gula_die_frames.append(pygame.image.load(os.path.join(gula_die_folder, fn)).convert_alpha())
-    assets[GULA_DIE] = gula_die_frames
-
-     # GULA COXA DE FRANGO
-    GULA_COXA = 'gula_coxa'
-    coxa_folder = os.path.join(IMG_DIR, "coxa_de_frango")
-    coxa_img = None
-    if os.path.isdir(coxa_folder):
-        
-        for f in os.listdir(coxa_folder):
-            if f.lower().endswith(".png"):
-                coxa_img = pygame.image.load(os.path.join(coxa_folder, f)).convert_alpha()
+def _png_files(folder):
+    """
+    Lista os .png de uma pasta de IMG_DIR, ordenados pelo número no nome.
+
+    Recebe:
+        folder (str): pasta relativa a IMG_DIR.
+
+    Retorna:
+        list: caminhos relativos a IMG_DIR (vazia se a pasta não existir).
+    """
+    full = os.path.join(IMG_DIR, folder)
+    if not os.path.isdir(full):
+        return []
+    files = [f for f in os.listdir(full) if f.lower().endswith(".png")]
+    return [os.path.join(folder, f) for f in sorted(files, key=_numeric_sort_key)]
+
+def asset_spec(display_sizes_only=ASSET_DISPLAY_SIZES_ONLY):
+    """
+    Monta a especificação de todas as imagens usadas pelo jogo.
+
+    Recebe:
+        display_sizes_only (bool): deixa de fora as imagens só de origem e já pede as
+                                   de DISPLAY_SIZES no tamanho da tela.
+
+    Retorna:
+        dict: chave -> (é lista, [(arquivo relativo a IMG_DIR, usa alpha, tamanho final ou None), ...])
+              Animações são listas de frames; imagens avulsas têm no máximo um arquivo.
+    """
+    spec = {}
+    for key, folder in ANIMATION_FOLDERS.items():
+        spec[key] = (True, [(rel, True, None) for rel in _png_files(folder)])
+
+    # GULA COXA DE FRANGO (primeira imagem da pasta)
+    coxa_size = DISPLAY_SIZES[GULA_COXA] if display_sizes_only else None
+    spec[GULA_COXA] = (False, [(rel, True, coxa_size) for rel in _png_files(COXA_FOLDER)[:1]])
+
+    for key, (rel, alpha, size) in IMAGE_FILES.items():
+        if display_sizes_only and key in SOURCE_ONLY_IMAGES:
+            continue
+        exists = os.path.isfile(os.path.join(IMG_DIR, rel))
+        spec[key] = (False, [(rel, alpha, size)] if exists else [])
+    return spec
+
+def _decode(rel, size, cache):
+    """
+    Decodifica um arquivo de imagem e o redimensiona, sem converter para o formato da tela.
+
+    Recebe:
+        rel (str): arquivo relativo a IMG_DIR.
+        size (tuple ou None): tamanho final, ou None para manter o original.
+        cache (dict): imagens já decodificadas nesta carga (evita ler o mesmo arquivo duas vezes).
+
+    Retorna:
+        pygame.Surface: imagem decodificada.
+    """
+    img = cache.get(rel)
+    if img is None:
+        img = pygame.image.load(os.path.join(IMG_DIR, rel))
+        cache[rel] = img
+    if size is not None:
+        img = pygame.transform.scale(img, size)
+    return img
+
+def _decode_source(rel, sizes):
+    """
+    Decodifica um arquivo uma única vez e gera todos os tamanhos pedidos dele.
+
+    Pode rodar numa thread de trabalho: não converte para o formato da tela.
+
+    Recebe:
+        rel (str): arquivo relativo a IMG_DIR.
+        sizes (list): tamanhos finais pedidos (None = tamanho original).
+
+    Retorna:
+        dict: tamanho -> pygame.Surface não convertida.
+    """
+    cache = {}
+    return {size: _decode(rel, size, cache) for size in sizes}
+
+def decode_spec(spec, workers=ASSET_LOAD_WORKERS):
+    """
+    Decodifica todos os arquivos da especificação (usado pelo loader direto e pelo bake).
+
+    O que faz:
+        - Agrupa os pedidos por arquivo, para cada arquivo ser lido uma vez só.
+        - Com workers > 0, decodifica os arquivos em paralelo num pool de threads
+          (pygame.image.load libera o GIL enquanto decodifica).
+
+    Recebe:
+        spec (dict): especificação retornada por asset_spec().
+        workers (int): quantidade de threads (0 = tudo na thread atual).
+
+    Retorna:
+        dict: chave -> lista de pygame.Surface não convertidas.
+    """
+    sizes_by_source = {}
+    for _, sources in spec.values():
+        for rel, _, size in sources:
+            sizes_by_source.setdefault(rel, [])
+            if size not in sizes_by_source[rel]:
+                sizes_by_source[rel].append(size)
+
+    rels = list(sizes_by_source)
+    if workers > 0:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_decode_source, rels, [sizes_by_source[r] for r in rels]))
+    else:
+        results = [_decode_source(rel, sizes_by_source[rel]) for rel in rels]
+    decoded = dict(zip(rels, results))
+
+    return {key: [decoded[rel][size] for rel, _, size in sources]
+            for key, (_, sources) in spec.items()}
+
+def decode_background(filename, size=(LARGURA, ALTURA), folder='inferno'):
+    """
+    Decodifica e redimensiona um cenário (por padrão da pasta IMG_DIR/inferno), sem converter.
+
+    Pode rodar numa thread de trabalho.
+
+    Recebe:
+        filename (str): nome do arquivo dentro de IMG_DIR/folder.
+        size (tuple): tamanho final.
+        folder (str): pasta dentro de IMG_DIR.
+
+    Retorna:
+        pygame.Surface ou None: o cenário, ou None se o arquivo não existir.
+    """
+    path = os.path.join(IMG_DIR, folder, filename)
+    if not os.path.isfile(path):
+        return None
+    return pygame.transform.scale(pygame.image.load(path), size)
+
+# Cenários já convertidos, compartilhados pelo processo inteiro (vale entre partidas):
+# (caminho, tamanho) -> superfície (ou None se o arquivo não existe)
+_backgrounds = {}
+
+def _background_key(filename, size, folder='inferno'):
+    return (os.path.join(IMG_DIR, folder, filename), tuple(size))
+
+def has_background(filename, size=(LARGURA, ALTURA)):
+    """
+    Diz se um cenário já está no cache de cenários.
+
+    Recebe:
+        filename (str): nome do arquivo dentro de IMG_DIR/inferno.
+        size (tuple): tamanho final.
+
+    Retorna:
+        bool
+    """
+    return _background_key(filename, size) in _backgrounds
+
+def store_background(filename, surface, size=(LARGURA, ALTURA)):
+    """
+    Guarda no cache um cenário já convertido (ex.: preparado pelo prefetcher).
+
+    Recebe:
+        filename (str): nome do arquivo dentro de IMG_DIR/inferno.
+        surface (pygame.Surface ou None): cenário convertido.
+        size (tuple): tamanho do cenário.
+
+    Retorna:
+        None
+    """
+    _backgrounds[_background_key(filename, size)] = surface
+
+def cached_backgrounds():
+    """
+    Retorna os cenários que estão no cache (para contabilizar memória).
+
+    Retorna:
+        dict: (caminho, tamanho) -> superfície.
+    """
+    return {key: surf for key, surf in _backgrounds.items() if surf is not None}
+
+def load_background(filename, size=(LARGURA, ALTURA), folder='inferno'):
+    """
+    Retorna um cenário convertido e redimensionado, lendo o disco só na primeira vez.
+
+    Salas com o mesmo arquivo recebem a mesma superfície, e o cache continua valendo
+    quando o jogo volta do menu ou da tela de game over.
+
+    Recebe:
+        filename (str): nome do arquivo dentro de IMG_DIR/folder.
+        size (tuple): tamanho final.
+        folder (str): pasta dentro de IMG_DIR (padrão: inferno).
+
+    Retorna:
+        pygame.Surface ou None: o cenário, ou None se não existir ou não puder ser lido.
+    """
+    key = _background_key(filename, size, folder)
+    if key in _backgrounds:
+        return _backgrounds[key]
+    try:
+        img = decode_background(filename, size, folder)
+        if img is not None:
+            img = prepare_surface(img)
+    except Exception as e:
+        print("Erro carregando bg:", key[0], e)
+        img = None
+    _backgrounds[key] = img
+    return img
+
+def bake_pack(path=PACK_PATH):
+    """
+    Gera (ou atualiza) o pacote pré-processado com todas as imagens da especificação.
+
+    O que faz:
+        - Só decodifica as imagens cujo arquivo de origem mudou desde o último bake;
+          as demais são copiadas do pacote anterior.
+
+    Recebe:
+        path (str): caminho do pacote.
+
+    Retorna:
+        tuple: (tamanho do pacote em bytes, quantidade de imagens decodificadas)
+    """
+    spec = asset_spec()
+    cache = {}
+    return asset_pack.write_pack(spec, lambda rel, size: _decode(rel, size, cache), path, groups=ATLAS_GROUPS)
+
+def _load_direct(spec, workers=ASSET_LOAD_WORKERS):
+    """
+    Carrega as imagens decodificando cada arquivo (caminho antigo, sem pacote).
+
+    O que faz:
+        - Decodifica os arquivos (em paralelo se workers > 0).
+        - Converte para o formato da tela aqui, na thread principal.
+
+    Recebe:
+        spec (dict): especificação retornada por asset_spec().
+        workers (int): quantidade de threads de decodificação.
+
+    Retorna:
+        dict: chave -> lista de pygame.Surface convertidas para o formato da tela.
+    """
+    decoded = decode_spec(spec, workers)
+    loaded = {}
+    for key, (_, sources) in spec.items():
+        loaded[key] = [img.convert_alpha() if alpha else img.convert()
+                       for (_, alpha, _), img in zip(sources, decoded[key])]
+    return loaded
+
+def benchmark_load(workers=ASSET_LOAD_WORKERS, repeat=3):
+    """
+    Mede o carregamento direto das imagens em modo serial e em modo paralelo.
+
+    Precisa de uma janela criada (pode ser com SDL_VIDEODRIVER=dummy).
+
+    Recebe:
+        workers (int): quantidade de threads do modo paralelo.
+        repeat (int): quantas vezes cada modo é medido (vale o melhor tempo).
+
+    Retorna:
+        dict: modo -> melhor tempo em segundos.
+    """
+    spec = asset_spec()
+    modes = {'serial': 0, f'paralelo ({workers} threads)': workers}
+    times = {}
+    for name, n in modes.items():
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _load_direct(spec, n)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        times[name] = best
+    return times
+
+def surface_bytes(value):
+    """
+    Calcula quantos bytes de pixels um asset ocupa.
+
+    Subsuperfícies (frames de um atlas) contam só a área do próprio frame.
+
+    Recebe:
+        value: pygame.Surface, lista de superfícies ou qualquer outro objeto.
+
+    Retorna:
+        int: bytes de pixels (0 para o que não for superfície).
+    """
+    if isinstance(value, pygame.Surface):
+        if value.get_parent() is not None:
+            return value.get_width() * value.get_height() * value.get_bytesize()
+        return value.get_pitch() * value.get_height()
+    if isinstance(value, (list, tuple)):
+        return sum(surface_bytes(v) for v in value)
+    return 0
+
+class AssetRegistry:
+    """
+    Dicionário de assets com carregamento sob demanda.
+
+    As chaves comuns são carregadas na criação. As chaves "preguiçosas" (animações
+    dos bosses) só são carregadas quando pedidas pela primeira vez e ficam num cache
+    LRU limitado por bytes: quando o total passa do orçamento, os conjuntos usados há
+    mais tempo são descartados e recarregados se forem pedidos de novo.
+
+    Chaves do mesmo grupo (mesmo personagem) são carregadas juntas, para que as
+    animações que dividem uma página de atlas leiam essa página uma vez só.
+    """
+
+    def __init__(self, spec, lazy_keys=(), budget=ASSET_CACHE_BUDGET, workers=ASSET_LOAD_WORKERS, groups=None):
+        """
+        Cria o registro e carrega as chaves que não são preguiçosas.
+
+        Recebe:
+            spec (dict): especificação retornada por asset_spec().
+            lazy_keys (iterable): chaves carregadas só quando pedidas.
+            budget (int): bytes máximos mantidos no cache das chaves preguiçosas.
+            workers (int): threads de decodificação quando não há pacote.
+            groups (dict ou None): nome do grupo -> chaves carregadas juntas.
+
+        Retorna:
+            None
+        """
+        self.spec = spec
+        self.lazy_keys = set(lazy_keys) & set(spec)
+        self.budget = budget
+        self.workers = workers
+        self._group_of = {}
+        for group_keys in (groups or {}).values():
+            for key in group_keys:
+                self._group_of[key] = tuple(k for k in group_keys if k in self.lazy_keys)
+
+        self._pack = asset_pack.open_pack(spec)
+        if self._pack is None and os.path.isfile(PACK_PATH):
+            print("Pacote de assets desatualizado, carregando imagens direto (rode: python asset_pack.py)")
+
+        self._eager = self._load([k for k in spec if k not in self.lazy_keys])
+        self._flipped = {}
+        self._flipped_pages = weakref.WeakKeyDictionary()
+        self._scaled = {}
+        self._lru = OrderedDict()
+        self._lru_bytes = 0
+
+    def decode(self, keys):
+        """
+        Lê as chaves do pacote (se atualizado) ou decodifica os arquivos, sem converter.
+
+        Não usa a tela nem altera o registro, então pode rodar numa thread de trabalho.
+
+        Recebe:
+            keys (list): chaves da especificação.
+
+        Retorna:
+            dict: chave -> lista de pygame.Surface não convertidas.
+        """
+        if not keys:
+            return {}
+        if self._pack is not None:
+            loaded = asset_pack.read_entries(self._pack, keys, convert=False)
+            if loaded is not None:
+                return loaded
+            # pacote incompleto: daqui em diante decodifica os arquivos
+            self._pack = None
+        return decode_spec({k: self.spec[k] for k in keys}, self.workers)
+
+    def alpha_flags(self, key):
+        """
+        Diz, para cada frame da chave, se ele usa alpha (convert_alpha) ou não (convert).
+
+        Recebe:
+            key (str): chave da especificação.
+
+        Retorna:
+            list: um bool por frame.
+        """
+        return [alpha for _, alpha, _ in self.spec[key][1]]
+
+    def _shape(self, key, surfs):
+        # animações ficam como lista; imagens avulsas viram a superfície (ou None)
+        if surfs is None or self.spec[key][0]:
+            return surfs
+        return surfs[0] if surfs else None
+
+    def _load(self, keys):
+        """
+        Carrega um grupo de chaves do pacote (se atualizado) ou decodificando os arquivos.
+
+        Recebe:
+            keys (list): chaves da especificação.
+
+        Retorna:
+            dict: chave -> lista de frames, ou superfície única (None se faltar o arquivo).
+        """
+        decoded = self.decode(keys)
+        converted = {}
+        result = {}
+        for key in keys:
+            surfs = atlas.convert_frames(decoded[key], self.alpha_flags(key), converted)
+            result[key] = self._shape(key, surfs)
+        return result
+
+    def store(self, key, frames, flipped=None):
+        """
+        Guarda no registro frames já convertidos (ex.: preparados em segundo plano).
+
+        Recebe:
+            key (str): chave da especificação.
+            frames (list): frames convertidos, na ordem da especificação.
+            flipped (list ou None): os mesmos frames já espelhados na horizontal.
+
+        Retorna:
+            None
+        """
+        value = self._shape(key, frames)
+        if key not in self.lazy_keys:
+            self._eager[key] = value
+            if flipped is not None:
+                self._flipped[key] = self._shape(key, flipped)
+            return
+        self._drop(key)
+        self._lru[key] = value
+        self._lru_bytes += surface_bytes(value)
+        if flipped is not None:
+            self._flipped[key] = self._shape(key, flipped)
+            self._lru_bytes += surface_bytes(self._flipped[key])
+        self._evict(protect={key})
+
+    def flipped(self, key):
+        """
+        Retorna a versão espelhada na horizontal de uma chave, criada uma vez só.
+
+        Recebe:
+            key (str): chave da especificação.
+
+        Retorna:
+            list, pygame.Surface ou None: frames espelhados (mesma forma de self[key]).
+        """
+        if key in self._flipped:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+            return self._flipped[key]
+        value = self[key]
+        if isinstance(value, list):
+            flip = prepare_frames(atlas.flip_frames(value, self._flipped_pages))
+        elif value is not None:
+            flip = prepare_surface(atlas.flip_frames([value], self._flipped_pages)[0])
+        else:
+            flip = None
+        self._flipped[key] = flip
+        if key in self._lru:
+            self._lru_bytes += surface_bytes(flip)
+            self._evict(protect={key})
+        return flip
+
+    def scaled(self, key, size):
+        """
+        Retorna uma imagem avulsa no tamanho pedido, redimensionada uma vez só.
+
+        Se a imagem já está nesse tamanho (ex.: carregada no tamanho da tela), devolve
+        a própria imagem, sem cópia.
+
+        Recebe:
+            key (str): chave de uma imagem avulsa.
+            size (tuple): tamanho desejado.
+
+        Retorna:
+            pygame.Surface ou None
+        """
+        value = self.get(key)
+        if value is None or value.get_size() == tuple(size):
+            return value
+        cache_key = (key, tuple(size))
+        if cache_key not in self._scaled:
+            self._scaled[cache_key] = prepare_surface(pygame.transform.scale(value, size))
+        return self._scaled[cache_key]
+
+    def is_loaded(self, key):
+        """
+        Diz se a chave já está carregada (não precisa ler nada do disco).
+
+        Recebe:
+            key (str): chave da especificação.
+
+        Retorna:
+            bool
+        """
+        return key in self._eager or key in self._lru
+
+    def prefetch(self, keys):
+        """
+        Garante que as chaves pedidas estejam carregadas (carrega as que faltam de uma vez).
+
+        Recebe:
+            keys (iterable): chaves preguiçosas a carregar (o grupo inteiro de cada uma
+                             é carregado junto).
+
+        Retorna:
+            None
+        """
+        expanded = []
+        for key in keys:
+            for k in self._group_of.get(key, (key,)):
+                if k in self.lazy_keys and k not in expanded:
+                    expanded.append(k)
+        keys = expanded
+        missing = [k for k in keys if k not in self._lru]
+        for key, value in self._load(missing).items():
+            self._lru[key] = value
+            self._lru_bytes += surface_bytes(value)
+        for key in keys:
+            self._lru.move_to_end(key)
+        self._evict(protect=set(keys))
+
+    def _drop(self, key):
+        # tira uma chave preguiçosa do cache (com a versão espelhada, se houver)
+        if key in self._lru:
+            self._lru_bytes -= surface_bytes(self._lru.pop(key))
+            self._lru_bytes -= surface_bytes(self._flipped.pop(key, None))
+            for cache_key in [k for k in self._scaled if k[0] == key]:
+                del self._scaled[cache_key]
+
+    def _evict(self, protect=()):
+        """
+        Descarta os conjuntos usados há mais tempo até o cache caber no orçamento.
+
+        Recebe:
+            protect (set): chaves que acabaram de ser pedidas e não podem sair.
+
+        Retorna:
+            None
+        """
+        for key in list(self._lru):
+            if self._lru_bytes <= self.budget:
                 break
-    assets[GULA_COXA] = coxa_img
-
-        # ===== GANÂNCIA =====
-    GANANCIA_IDLE = 'ganancia_idle'
-    ganancia_idle_folder = os.path.join(IMG_DIR, "ganancia_parado")
-    ganancia_idle_frames = []
-    if os.path.isdir(ganancia_idle_folder):
-        files = [f for f in os.listdir(ganancia_idle_folder) if f.lower().endswith(".png")]
-        files = sorted(files, key=_numeric_sort_key)
-        for fn in files:
-            ganancia_idle_frames.append(pygame.image.load(os.path.join(ganancia_idle_folder, fn)).convert_alpha())
-    assets[GANANCIA_IDLE] = ganancia_idle_frames
-
-    GANANCIA_WALK = 'ganancia_walk'
-    ganancia_walk_folder = os.path.join(IMG_DIR, "ganancia_andando")
-    ganancia_walk_frames = []
-    if os.path.isdir(ganancia_walk_folder):
-        files = [f for f in os.listdir(ganancia_walk_folder) if f.lower().endswith(".png")]
-        files = sorted(files, key=_numeric_sort_key)
-        for fn in files:
-            ganancia_walk_frames.append(pygame.image.load(os.path.join(ganancia_walk_folder, fn)).convert_alpha())
-    assets[GANANCIA_WALK] = ganancia_walk_frames
-
-    GANANCIA_ATTACK = 'ganancia_attack'
-    ganancia_attack_folder = os.path.join(IMG_DIR, "ganancia_ataque")
-    ganancia_attack_frames = []
-    if os.path.isdir(ganancia_attack_folder):
-        files = [f for f in os.listdir(ganancia_attack_folder) if f.lower().endswith(".png")]
-        files = sorted(files, key=_numeric_sort_key)
-        for fn in files:
-            ganancia_attack_frames.append(pygame.image.load(os.path.join(ganancia_attack_folder, fn)).convert_alpha())
-    assets[GANANCIA_ATTACK] = ganancia_attack_frames
-
-    GANANCIA_DIE = 'ganancia_die'
-    ganancia_die_folder = os.path.join(IMG_DIR, "ganancia_morrendo")
-    ganancia_die_frames = []
-    if os.path.isdir(ganancia_die_folder):
-        files = [f for f in os.listdir(ganancia_die_folder) if f.lower().endswith(".png")]
-        files = sorted(files, key=_numeric_sort_key)
-        for fn in files:
-            ganancia_die_frames.append(pygame.image.load(os.path.join(ganancia_die_folder, fn)).convert_alpha())
-    assets[GANANCIA_DIE] = ganancia_die_frames
-
-
-    #Background menu
-    MENU_BACK = 'menu_back'
-    assets[MENU_BACK] = pygame.image.load(os.path.join(IMG_DIR, "menu_hell.jpg")).convert()
-    assets[MENU_BACK] = pygame.transform.scale(assets[MENU_BACK],(LARGURA,ALTURA))
-
-    #imagem dos comandos
-    COMMAND_SCR = 'command_scr'
-
-    assets[COMMAND_SCR] = pygame.image.load(os.path.join(IMG_DIR, "Gemini_Generated_Image_4trti34trti34trt.png")).convert()
-    assets[COMMAND_SCR] = pygame.transform.scale(assets[COMMAND_SCR],(LARGURA,ALTURA))
-
-    #background game over
-
-    GAME_OVER_BACK = 'game_over_back'
-
-    assets[GAME_OVER_BACK] = pygame.image.load(os.path.join(IMG_DIR, "game_over_back.jpg")).convert()
-    assets[GAME_OVER_BACK] = pygame.transform.scale(assets[GAME_OVER_BACK], (LARGURA,ALTURA))
-
-    #ICONE
-
-    ICON= 'icon'
-    assets[ICON]= pygame.image.load(os.path.join(IMG_DIR, 'Gemini_Generated_Image_8p5c2s8p5c2s8p5c.png')).convert_alpha()
-    assets['game_icon'] = pygame.transform.scale(assets[ICON],(32,32))
+            if key not in protect:
+                self._drop(key)
+
+    def resident_bytes(self):
+        """
+        Retorna quantos bytes de pixels estão carregados no registro.
+
+        Retorna:
+            int: bytes das chaves comuns (e suas versões espelhadas) mais as do cache LRU.
+        """
+        eager_flipped = [v for k, v in self._flipped.items() if k not in self._lru]
+        return surface_bytes(list(self._eager.values())) + surface_bytes(eager_flipped) + self._lru_bytes
+
+    def surfaces(self):
+        """
+        Lista o que está carregado no registro, para contabilizar memória.
+
+        Retorna:
+            list: pares (nome, valor) das chaves comuns, do cache LRU e das versões
+                  espelhadas (marcadas com ' (espelhado)').
+        """
+        items = list(self._eager.items()) + list(self._lru.items())
+        items += [(key + ' (espelhado)', value) for key, value in self._flipped.items()]
+        items += [('%s (%dx%d)' % (key, size[0], size[1]), value) for (key, size), value in self._scaled.items()]
+        return items
+
+    def __getitem__(self, key):
+        if key in self._eager:
+            return self._eager[key]
+        if key in self.lazy_keys:
+            self.prefetch([key])
+            return self._lru[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._eager[key] = value
+
+    def __contains__(self, key):
+        return key in self._eager or key in self.lazy_keys
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+def flipped_frames(assets, key):
+    """
+    Retorna os frames de uma chave espelhados na horizontal.
+
+    Com um AssetRegistry, usa a versão espelhada guardada no registro (criada uma vez
+    só ou preparada em segundo plano); com um dict comum, espelha na hora.
+
+    Recebe:
+        assets (AssetRegistry ou dict): assets do jogo.
+        key (str): chave da animação ou imagem.
+
+    Retorna:
+        list, pygame.Surface ou None: mesma forma de assets[key].
+    """
+    if hasattr(assets, 'flipped'):
+        return assets.flipped(key)
+    value = assets.get(key)
+    if isinstance(value, list):
+        return prepare_frames([pygame.transform.flip(f, True, False) for f in value])
+    return prepare_surface(pygame.transform.flip(value, True, False)) if value is not None else None
+
+def scaled_image(assets, key, size):
+    """
+    Retorna uma imagem avulsa no tamanho pedido.
+
+    Com um AssetRegistry, usa o cache de imagens redimensionadas do registro; com um
+    dict comum, redimensiona na hora.
+
+    Recebe:
+        assets (AssetRegistry ou dict): assets do jogo.
+        key (str): chave da imagem.
+        size (tuple): tamanho desejado.
+
+    Retorna:
+        pygame.Surface ou None
+    """
+    if hasattr(assets, 'scaled'):
+        return assets.scaled(key, size)
+    value = assets.get(key)
+    if value is None or value.get_size() == tuple(size):
+        return value
+    return prepare_surface(pygame.transform.scale(value, size))
+
+class AnimationBank:
+    """
+    Frames de cada animação prontos para os dois lados, consultados por
+    (animação, lado, índice).
+
+    As versões espelhadas são montadas uma vez (quando a animação é pedida pela
+    primeira vez, normalmente no construtor do personagem) e reaproveitadas em todo
+    frame, sem transform.flip nem novas superfícies durante o jogo.
+    """
+
+    def __init__(self, assets, keys=()):
+        """
+        Recebe:
+            assets (AssetRegistry ou dict): assets do jogo.
+            keys (iterable): animações a preparar já na criação.
+
+        Retorna:
+            None
+        """
+        self.assets = assets
+        self._sequences = {}
+        for key in keys:
+            self.frames(key, 1)
+            self.frames(key, -1)
+
+    def frames(self, key, facing):
+        """
+        Retorna a sequência de uma animação virada para o lado pedido.
+
+        Recebe:
+            key (str): chave da animação (ou imagem única).
+            facing (int): 1 = direita, -1 = esquerda.
+
+        Retorna:
+            list: frames da animação (lista vazia se a chave não existir).
+        """
+        sequence = self._sequences.get((key, facing))
+        if sequence is None:
+            value = self.assets.get(key) if self.assets else None
+            if value is not None and facing != NATIVE_FACING.get(key, 1):
+                value = flipped_frames(self.assets, key)
+            if value is None:
+                sequence = []
+            elif isinstance(value, list):
+                sequence = value
+            else:
+                sequence = [value]
+            self._sequences[(key, facing)] = sequence
+        return sequence
+
+    def frame(self, key, facing, index):
+        """
+        Retorna um frame de uma animação virada para o lado pedido.
+
+        Recebe:
+            key (str): chave da animação.
+            facing (int): 1 = direita, -1 = esquerda.
+            index (int): índice do frame.
+
+        Retorna:
+            pygame.Surface
+        """
+        return self.frames(key, facing)[index]
 
+def load_assets():
+    assets = AssetRegistry(asset_spec(), lazy_keys=LAZY_ASSETS, groups=ATLAS_GROUPS)
 
     #Sons
 
-    ATK_SOUND='atk_sound'
     assets[ATK_SOUND]=pygame.mixer.Sound(os.path.join(SND_DIR,'sword-slash-and-swing-185432.wav'))
-    HURT_SOUND = 'hurt_sound'
     assets[HURT_SOUND] = pygame.mixer.Sound(os.path.join(SND_DIR,'male_hurt7-48124.wav'))
 
 
     return assets
+
+def load_headless_assets(keys=DANTE_ASSETS + LAZY_ASSETS):
+    """
+    Carrega as imagens sem converter para o formato da tela (não precisa de janela).
+
+    Usado pela simulação sem tela (simulacao.py): os frames só servem para dar o
+    tamanho dos rects. Sons e telas de fundo não são carregados.
+
+    Recebe:
+        keys (iterable): chaves a carregar (padrão: Dante e os bosses).
+
+    Retorna:
+        dict: chave -> lista de frames, ou superfície única (None se faltar o arquivo).
+    """
+    full_spec = asset_spec()
+    spec = {key: full_spec[key] for key in keys if key in full_spec}
+    opened = asset_pack.open_pack(full_spec)
+    decoded = asset_pack.read_entries(opened, spec.keys(), convert=False) if opened is not None else None
+    if decoded is None:
+        decoded = decode_spec(spec)
+    return {key: frames if spec[key][0] else (frames[0] if frames else None)
+            for key, frames in decoded.items()}
+
+
+if __name__ == '__main__':
+    # relatório de tempo de carregamento, sem abrir janela de verdade
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    results = benchmark_load(max(1, ASSET_LOAD_WORKERS))
+    serial = results['serial']
+    for name, elapsed in results.items():
+        print(f"{name:<24} {elapsed * 1000:8.1f} ms  ({serial / elapsed:.2f}x)")
@@ -0,0 +1,164 @@
+# atlas.py
+# Empacotamento de frames em atlas (poucas superfícies grandes com vários frames).
+import math
+import pygame
+from surfaces import prepare_surface
+
+
+def pack_shelves(sizes, max_size):
+    """
+    Distribui retângulos em páginas usando prateleiras (next-fit por altura decrescente).
+
+    O que faz:
+        - Ordena os retângulos do mais alto para o mais baixo.
+        - Preenche cada prateleira da esquerda para a direita; quando não cabe mais,
+          abre uma prateleira nova embaixo; quando a página enche, abre outra página.
+        - A largura da página é escolhida perto da raiz da área total (página quase
+          quadrada), limitada por max_size.
+
+    Recebe:
+        sizes (list): lista de (largura, altura).
+        max_size (int): lado máximo de uma página.
+
+    Retorna:
+        tuple: (posições, tamanhos das páginas), onde posições[i] = (página, x, y)
+               do retângulo i e tamanhos das páginas é uma lista de (largura, altura).
+    """
+    if not sizes:
+        return [], []
+    area = sum(w * h for w, h in sizes)
+    widest = max(w for w, _ in sizes)
+    page_w = min(max_size, max(widest, int(math.ceil(math.sqrt(area)))))
+
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    pages = []
+    page = 0
+    x = y = shelf_h = used_w = 0
+    for i in order:
+        w, h = sizes[i]
+        if w > max_size or h > max_size:
+            raise ValueError(f"frame {w}x{h} não cabe numa página de {max_size}px")
+        if x + w > page_w:
+            y += shelf_h
+            x = shelf_h = 0
+        if y + h > max_size:
+            pages.append((used_w, y + shelf_h if x else y))
+            page += 1
+            x = y = shelf_h = used_w = 0
+        positions[i] = (page, x, y)
+        x += w
+        shelf_h = max(shelf_h, h)
+        used_w = max(used_w, x)
+    pages.append((used_w, y + shelf_h))
+    return positions, pages
+
+
+def build_pages(frames, max_size):
+    """
+    Copia os frames para páginas de atlas (RGBA, sem mistura de alpha).
+
+    Recebe:
+        frames (list): superfícies dos frames.
+        max_size (int): lado máximo de uma página.
+
+    Retorna:
+        tuple: (páginas, posições), onde posições[i] = (página, pygame.Rect) do frame i.
+    """
+    positions, page_sizes = pack_shelves([f.get_size() for f in frames], max_size)
+    pages = [pygame.Surface(size, pygame.SRCALPHA, 32) for size in page_sizes]
+    placed = []
+    for frame, (page, x, y) in zip(frames, positions):
+        # a página começa zerada, então BLEND_RGBA_MAX copia os pixels exatamente
+        pages[page].blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        placed.append((page, pygame.Rect((x, y), frame.get_size())))
+    return pages, placed
+
+
+def frame_from_page(page, rect):
+    """
+    Retorna o frame de uma página: a própria página se o retângulo a cobre inteira,
+    senão uma subsuperfície (que compartilha os pixels da página).
+
+    Recebe:
+        page (pygame.Surface): página do atlas.
+        rect (pygame.Rect ou tuple): (x, y, largura, altura) do frame na página.
+
+    Retorna:
+        pygame.Surface
+    """
+    rect = pygame.Rect(rect)
+    if rect.topleft == (0, 0) and rect.size == page.get_size():
+        return page
+    return page.subsurface(rect)
+
+
+def convert_frames(frames, alphas, converted=None):
+    """
+    Converte frames para o formato da tela mantendo o atlas.
+
+    O que faz:
+        - Frames que são subsuperfícies de uma página: converte a página uma vez só e
+          refaz as subsuperfícies sobre a página convertida.
+        - Frames avulsos: convert / convert_alpha (imagens com alpha que não têm
+          transparência viram opacas).
+        - Todos passam por surfaces.prepare_surface (RLEACCEL nos frames transparentes).
+
+    Recebe:
+        frames (list): superfícies não convertidas.
+        alphas (list): um bool por frame (usa convert_alpha ou convert).
+        converted (dict ou None): páginas já convertidas (página -> página convertida),
+                                  para reaproveitar entre chamadas.
+
+    Retorna:
+        list: frames convertidos.
+    """
+    if converted is None:
+        converted = {}
+    result = []
+    for frame, alpha in zip(frames, alphas):
+        parent = frame.get_parent()
+        if parent is None:
+            result.append(prepare_surface(frame if alpha else frame.convert()))
+            continue
+        page = converted.get(parent)
+        if page is None:
+            page = parent.convert_alpha() if alpha else parent.convert()
+            converted[parent] = page
+        result.append(prepare_surface(page.subsurface(pygame.Rect(frame.get_offset(), frame.get_size()))))
+    return result
+
+
+def flip_frames(frames, flipped_pages=None):
+    """
+    Espelha frames na horizontal mantendo o atlas.
+
+    O que faz:
+        - Para subsuperfícies, espelha a página inteira uma vez e usa o retângulo
+          espelhado (x' = largura da página - x - largura do frame).
+        - Frames avulsos são espelhados um a um.
+
+    Recebe:
+        frames (list): superfícies dos frames.
+        flipped_pages (dict ou None): páginas já espelhadas (página -> página espelhada),
+                                      para outras animações da mesma página reaproveitarem.
+
+    Retorna:
+        list: frames espelhados.
+    """
+    if flipped_pages is None:
+        flipped_pages = {}
+    result = []
+    for frame in frames:
+        parent = frame.get_parent()
+        if parent is None:
+            result.append(pygame.transform.flip(frame, True, False))
+            continue
+        page = flipped_pages.get(parent)
+        if page is None:
+            page = pygame.transform.flip(parent, True, False)
+            flipped_pages[parent] = page
+        x, y = frame.get_offset()
+        w, h = frame.get_size()
+        result.append(page.subsurface(pygame.Rect(page.get_width() - x - w, y, w, h)))
+    return result
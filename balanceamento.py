@@ -0,0 +1,231 @@
+# balanceamento.py
+# Lutas em lote contra um boss, sem janela e em vários processos, para ajustar os
+# parâmetros (delay das coxas, traços da Ira, fúria, vida e dano) com números.
+#
+# Exemplo:
+#   python balanceamento.py --boss ira --fights 2000 --set trace_count=8,16 --set fury_mult=1.2,1.5
+# gera balanceamento.csv (um resumo por conjunto de parâmetros) e balanceamento.json
+# (resumo + distribuições completas).
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from config import BALANCE_WORKERS
+
+# sala de cada boss (a luta começa nela, com o boss já presente)
+BOSS_ROOMS = {'gula': 2, 'ganancia': 4, 'ira': 6}
+
+# tempo máximo (ms simulados) de uma luta antes de contar como empate
+FIGHT_MAX_MS = 2 * 60 * 1000
+
+_worker_assets = None   # imagens carregadas uma vez em cada processo
+
+
+def _init_worker():
+    # roda uma vez por processo: sem janela e sem som, só as imagens dos sprites
+    global _worker_assets
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from assets import load_headless_assets
+    _worker_assets = load_headless_assets()
+
+
+def fight(boss, params, seed, policy='dodge', max_ms=FIGHT_MAX_MS):
+    """
+    Roda uma luta contra um boss, começando na sala dele.
+
+    Recebe:
+        boss (str): 'gula', 'ganancia' ou 'ira'.
+        params (dict): argumentos do construtor do boss (ex.: {'trace_count': 8}).
+        seed (int): semente do random (cada luta tem a sua).
+        policy (str): jogador de teste (chave de simulacao.POLICIES).
+        max_ms (float): tempo máximo simulado da luta (ms).
+
+    Retorna:
+        dict: 'result' ('win', 'loss' ou 'timeout'), 'time_ms', 'damage_taken' (vida
+              perdida por Dante) e 'boss_hp' (vida que sobrou no boss).
+    """
+    from simulacao import Simulation, POLICIES
+    if _worker_assets is None:
+        _init_worker()
+    random.seed(seed)
+    room = BOSS_ROOMS[boss]
+    player = POLICIES[policy]
+    sim = Simulation(_worker_assets, room=room, boss_kwargs={boss: params})
+    target = sim.bosses_by_room()[room]
+    result = 'timeout'
+    while sim.clock() < max_ms:
+        sim.step(player(sim))
+        if sim.victory or sim.bosses_by_room()[room] is None:
+            result = 'win'
+            break
+        if sim.game_over:
+            result = 'loss'
+            break
+    dante = sim.dante
+    return {
+        'result': result,
+        'time_ms': sim.clock(),
+        'damage_taken': dante.max_hp - max(0, dante.hp),
+        'boss_hp': max(0, getattr(target, 'hp', 0)) if result != 'win' else 0,
+    }
+
+
+def _fight_task(task):
+    # adaptador para ProcessPoolExecutor.map (um argumento só)
+    return fight(*task)
+
+
+def _percentile(values, q):
+    # percentil pelo posto mais próximo (values já ordenada); None se vazia
+    if not values:
+        return None
+    i = min(len(values) - 1, max(0, int(round(q / 100.0 * (len(values) - 1)))))
+    return values[i]
+
+
+def summarize(params, results):
+    """
+    Resume as lutas de um conjunto de parâmetros.
+
+    Recebe:
+        params (dict): parâmetros do boss.
+        results (list): resultados de fight().
+
+    Retorna:
+        dict: parâmetros, 'fights', 'win_rate', 'loss_rate', 'timeout_rate', tempo até
+              matar (só vitórias) e dano sofrido (todas as lutas): média e p10/p50/p90.
+    """
+    n = len(results)
+    ttk = sorted(r['time_ms'] for r in results if r['result'] == 'win')
+    damage = sorted(r['damage_taken'] for r in results)
+    row = dict(params)
+    row['fights'] = n
+    for result in ('win', 'loss', 'timeout'):
+        row[result + '_rate'] = sum(1 for r in results if r['result'] == result) / n if n else 0.0
+    for name, values in (('ttk_ms', ttk), ('damage', damage)):
+        row[name + '_mean'] = sum(values) / len(values) if values else None
+        for q in (10, 50, 90):
+            row['%s_p%d' % (name, q)] = _percentile(values, q)
+    return row
+
+
+def param_grid(sets):
+    """
+    Monta todas as combinações dos valores pedidos.
+
+    Recebe:
+        sets (list): textos 'nome=v1,v2,...' (números viram int ou float).
+
+    Retorna:
+        list: um dict de parâmetros por combinação ([{}] se não houver nenhum).
+    """
+    names = []
+    choices = []
+    for item in sets:
+        name, _, values = item.partition('=')
+        parsed = []
+        for v in values.split(','):
+            v = v.strip()
+            try:
+                parsed.append(int(v))
+            except ValueError:
+                parsed.append(float(v))
+        names.append(name.strip())
+        choices.append(parsed)
+    return [dict(zip(names, combo)) for combo in itertools.product(*choices)]
+
+
+def run_batch(boss, grid, fights, policy='dodge', seed=0, workers=BALANCE_WORKERS,
+              max_ms=FIGHT_MAX_MS):
+    """
+    Roda `fights` lutas para cada conjunto de parâmetros, espalhadas pelos núcleos.
+
+    As sementes são as mesmas em todos os conjuntos (seed, seed+1, ...), então as
+    diferenças entre eles vêm dos parâmetros e não da sorte.
+
+    Recebe:
+        boss (str): boss testado.
+        grid (list): conjuntos de parâmetros (ver param_grid).
+        fights (int): lutas por conjunto.
+        policy (str): jogador de teste.
+        seed (int): primeira semente.
+        workers (int): processos (0 = um por núcleo).
+        max_ms (float): tempo máximo de cada luta (ms simulados).
+
+    Retorna:
+        list: um item por conjunto com 'summary' (ver summarize) e 'results' (lutas).
+    """
+    tasks = [(boss, params, seed + i, policy, max_ms) for params in grid for i in range(fights)]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        results = list(pool.map(_fight_task, tasks, chunksize=chunksize))
+    batches = []
+    for k, params in enumerate(grid):
+        chunk = results[k * fights:(k + 1) * fights]
+        batches.append({'params': params, 'summary': summarize(params, chunk), 'results': chunk})
+    return batches
+
+
+def write_reports(batches, out):
+    """
+    Grava o resumo em <out>.csv e resumo + distribuições em <out>.json.
+
+    Recebe:
+        batches (list): retorno de run_batch().
+        out (str): caminho sem extensão.
+
+    Retorna:
+        None
+    """
+    rows = [b['summary'] for b in batches]
+    fields = []
+    for row in rows:
+        fields += [f for f in row if f not in fields]
+    with open(out + '.csv', 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    data = [{
+        'params': b['params'],
+        'summary': b['summary'],
+        'results': [r['result'] for r in b['results']],
+        'time_ms': [r['time_ms'] for r in b['results']],
+        'damage_taken': [r['damage_taken'] for r in b['results']],
+        'boss_hp': [r['boss_hp'] for r in b['results']],
+    } for b in batches]
+    with open(out + '.json', 'w') as f:
+        json.dump(data, f, indent=1)
+
+
+if __name__ == "__main__":
+    from simulacao import POLICIES
+    parser = argparse.ArgumentParser(description='Lutas em lote para balancear os bosses.')
+    parser.add_argument('--boss', choices=sorted(BOSS_ROOMS), default='ira')
+    parser.add_argument('--fights', type=int, default=200, help='lutas por conjunto de parâmetros')
+    parser.add_argument('--set', action='append', default=[], metavar='NOME=V1,V2',
+                        help='parâmetro do construtor do boss e valores a testar (pode repetir)')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='dodge')
+    parser.add_argument('--workers', type=int, default=BALANCE_WORKERS, help='0 = um por núcleo')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-ms', type=float, default=FIGHT_MAX_MS)
+    parser.add_argument('--out', default='balanceamento', help='caminho sem extensão')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    batches = run_batch(args.boss, param_grid(args.set), args.fights, args.policy,
+                        args.seed, args.workers, args.max_ms)
+    write_reports(batches, args.out)
+    total = sum(len(b['results']) for b in batches)
+    for b in batches:
+        s = b['summary']
+        print('%-40s vitórias %5.1f%%  ttk p50 %s ms  dano p50 %s' % (
+            b['params'] or '(padrão)', 100 * s['win_rate'],
+            '-' if s['ttk_ms_p50'] is None else '%.0f' % s['ttk_ms_p50'], s['damage_p50']))
+    print('%d lutas em %.1f s -> %s.csv / %s.json' % (total, time.perf_counter() - start,
+                                                      args.out, args.out))
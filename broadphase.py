@@ -0,0 +1,256 @@
+# broadphase.py
+# Grade uniforme (spatial hash) para as colisões do combate: sprites e projéteis se
+# registram a cada passo e as consultas só olham as células perto da área pedida.
+import numpy as np
+import pygame
+from config import BROADPHASE_CELL, BROADPHASE_MIN_POOL
+
+# chave de célula dos projéteis: cy * _ROW + cx (cx cabe com folga em +-_ROW/2)
+_ROW = 1 << 20
+_NO_HITS = np.empty(0, np.intp)
+
+
+class SpatialHash:
+    """
+    Grade uniforme com as entidades e os projéteis do combate.
+
+    O que faz:
+        - Sprites entram em todas as células que o rect deles toca (dict de listas);
+          a distribuição nas células fica para a primeira consulta de sprites, então
+          um passo sem ataque não paga por ela.
+        - Projéteis de um ProjectilePool entram de uma vez (NumPy): cada um fica na
+          célula do seu canto superior esquerdo, numa lista de índices ordenada por
+          célula, e as consultas aumentam a área pedida pelo maior projétil do pool.
+          O índice só é montado na primeira consulta e só para pools grandes
+          (config.BROADPHASE_MIN_POOL); os pequenos são testados inteiros.
+        - query_rect()/query_circle() devolvem os sprites que encostam na área;
+          query_pool() devolve os projéteis de um pool que encostam num retângulo.
+
+    O custo de cada consulta depende de quantas coisas estão perto da área pedida,
+    não de quantas existem na sala. A grade é refeita a cada passo (clear + insert);
+    os índices de um pool valem até o pool mudar (step/remove).
+    """
+
+    def __init__(self, cell=BROADPHASE_CELL, min_pool=BROADPHASE_MIN_POOL):
+        """
+        Recebe:
+            cell (int): lado de cada célula em px.
+            min_pool (int): tamanho mínimo de pool para montar o índice por célula.
+
+        Retorna:
+            None
+        """
+        self.cell = int(cell)
+        self.min_pool = min_pool
+        self._cells = {}   # (cx, cy) -> sprites
+        self._pending = []  # grupos de sprites registrados e ainda não distribuídos
+        self._pools = {}   # id(pool) -> [pool, índice (ou None enquanto não montado)]
+
+    def clear(self):
+        """
+        Esvazia a grade (antes de registrar tudo de novo).
+
+        Retorna:
+            None
+        """
+        self._cells.clear()
+        self._pending.clear()
+        self._pools.clear()
+
+    def _span(self, left, top, right, bottom):
+        # células (colunas e linhas) tocadas por um retângulo
+        c = self.cell
+        return (range(int(left) // c, (int(right) - 1) // c + 1),
+                range(int(top) // c, (int(bottom) - 1) // c + 1))
+
+    def insert(self, obj, rect=None):
+        """
+        Registra um sprite em todas as células que o rect dele toca.
+
+        Recebe:
+            obj: sprite (ou qualquer objeto).
+            rect (pygame.Rect ou None): área do objeto (None = obj.rect).
+
+        Retorna:
+            None
+        """
+        left, top, right, bottom = obj.rect if rect is None else rect
+        right += left
+        bottom += top
+        c = self.cell
+        cells = self._cells
+        for cy in range(top // c, (bottom - 1) // c + 1):
+            for cx in range(left // c, (right - 1) // c + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = [obj]
+                else:
+                    cell.append(obj)
+
+    def insert_sprites(self, sprites):
+        """
+        Registra vários sprites (ex.: um pygame.sprite.Group). Os rects são lidos na
+        primeira consulta de sprites depois do registro.
+
+        Recebe:
+            sprites (iterable): sprites com rect.
+
+        Retorna:
+            None
+        """
+        self._pending.append(sprites)
+
+    def insert_pool(self, pool):
+        """
+        Registra todos os projéteis de um pool de uma vez.
+
+        Recebe:
+            pool (projeteis.ProjectilePool): projéteis.
+
+        Retorna:
+            None
+        """
+        self._pools[id(pool)] = [pool, None]
+
+    def _index(self, pool):
+        # chaves de célula ordenadas e limites dos projéteis na mesma ordem
+        n = len(pool)
+        c = self.cell
+        x, y = pool.x[:n], pool.y[:n]
+        keys = (y // c).astype(np.int64) * _ROW + (x // c).astype(np.int64)
+        order = np.argsort(keys, kind='stable')
+        # cópias na ordem das células: cada linha da consulta vira uma fatia contínua
+        left = x[order]
+        top = y[order]
+        right = left + pool.w[:n][order]
+        bottom = top + pool.h[:n][order]
+        armed = pool.arm[:n][order] <= 0
+        return (keys[order], order, left, top, right, bottom, armed,
+                int(pool.w[:n].max()), int(pool.h[:n].max()))
+
+    def _candidates(self, rect):
+        # sprites registrados nas células do retângulo, sem repetição
+        if self._pending:
+            pending = self._pending
+            self._pending = []
+            for sprites in pending:
+                for obj in sprites:
+                    self.insert(obj)
+        cols, rows = self._span(rect.left, rect.top, rect.right, rect.bottom)
+        cells = self._cells
+        found = []
+        seen = set()
+        for cy in rows:
+            for cx in cols:
+                for obj in cells.get((cx, cy), ()):
+                    if id(obj) not in seen:
+                        seen.add(id(obj))
+                        found.append(obj)
+        return found
+
+    def query_rect(self, rect):
+        """
+        Sprites cujo rect encosta no retângulo pedido.
+
+        Recebe:
+            rect (pygame.Rect): área da consulta.
+
+        Retorna:
+            list: sprites.
+        """
+        return [obj for obj in self._candidates(rect) if rect.colliderect(obj.rect)]
+
+    def query_circle(self, center, radius):
+        """
+        Sprites cujo rect encosta no círculo pedido.
+
+        Recebe:
+            center (tuple): centro (x, y).
+            radius (float): raio em px.
+
+        Retorna:
+            list: sprites.
+        """
+        cx, cy = center
+        bounds = pygame.Rect(int(cx - radius), int(cy - radius), int(2 * radius) + 2, int(2 * radius) + 2)
+        found = []
+        r2 = radius * radius
+        for obj in self._candidates(bounds):
+            rect = obj.rect
+            # ponto do rect mais perto do centro
+            dx = cx - max(rect.left, min(cx, rect.right))
+            dy = cy - max(rect.top, min(cy, rect.bottom))
+            if dx * dx + dy * dy <= r2:
+                found.append(obj)
+        return found
+
+    def query_pool(self, pool, rect, armed=True, exact=True):
+        """
+        Projéteis de um pool que encostam num retângulo.
+
+        Recebe:
+            pool (projeteis.ProjectilePool): pool registrado com insert_pool().
+            rect (pygame.Rect): área da consulta.
+            armed (bool): considerar só os que já causam dano (se exact).
+            exact (bool): False devolve só os candidatos das células (sem o teste final).
+
+        Retorna:
+            numpy.ndarray: índices no pool.
+        """
+        entry = self._pools.get(id(pool))
+        if entry is None or not len(pool):
+            return _NO_HITS
+        if len(pool) < self.min_pool:
+            # pool pequeno: o teste vetorizado com todos é mais barato que o índice
+            return pool.hits(rect, armed) if exact else np.arange(len(pool))
+        if entry[1] is None:
+            entry[1] = self._index(pool)
+        keys, order, left, top, right, bottom, is_armed, max_w, max_h = entry[1]
+        # um projétil está na célula do seu canto: amplia a área para cima/esquerda
+        cols, rows = self._span(rect.left - max_w, rect.top - max_h, rect.right, rect.bottom)
+        row_keys = np.arange(rows.start, rows.stop, dtype=np.int64) * _ROW
+        lo = np.searchsorted(keys, row_keys + cols.start, 'left')
+        hi = np.searchsorted(keys, row_keys + (cols.stop - 1), 'right')
+        spans = []
+        for a, b in zip(lo.tolist(), hi.tolist()):
+            if b <= a:
+                continue
+            if exact:
+                mask = ((left[a:b] < rect.right) & (right[a:b] > rect.left)
+                        & (top[a:b] < rect.bottom) & (bottom[a:b] > rect.top))
+                if armed:
+                    mask &= is_armed[a:b]
+                if mask.any():
+                    spans.append(order[a:b][mask])
+            else:
+                spans.append(order[a:b])
+        if not spans:
+            return _NO_HITS
+        return spans[0] if len(spans) == 1 else np.concatenate(spans)
+
+
+if __name__ == "__main__":
+    # compara a grade com o teste de todos contra todos numa sala cheia
+    import time
+    from projeteis import ProjectilePool
+
+    rng = np.random.default_rng(0)
+    grid = SpatialHash(min_pool=0)
+    for count in (100, 1000, 10000, 50000):
+        pool = ProjectilePool(capacity=count)
+        pool.spawn(rng.uniform(0, 1280, count), rng.uniform(0, 720, count), 16, 16)
+        queries = [pygame.Rect(int(x), int(y), 80, 120)
+                   for x, y in zip(rng.uniform(0, 1200, 50), rng.uniform(0, 600, 50))]
+        start = time.perf_counter()
+        for _ in range(20):
+            brute = [pool.hits(q) for q in queries]
+        brute_ms = (time.perf_counter() - start) * 1000 / 20
+        start = time.perf_counter()
+        for _ in range(20):
+            grid.clear()
+            grid.insert_pool(pool)
+            hashed = [grid.query_pool(pool, q) for q in queries]
+        grid_ms = (time.perf_counter() - start) * 1000 / 20
+        assert all(sorted(a.tolist()) == sorted(b.tolist()) for a, b in zip(brute, hashed))
+        print('%5d projéteis, %d consultas: todos contra todos %.3f ms, grade %.3f ms (com registro)'
+              % (count, len(queries), brute_ms, grid_ms))
@@ -1,6 +1,6 @@
 import pygame
 from config import LARGURA, ALTURA, GRAVIDADE
-from assets import DANTE_WALK
+from assets import DANTE_WALK, DANTE_DIE, DANTE_HURT, DANTE_ATTACK, AnimationBank
 import sys
 import math
 
@@ -27,6 +27,7 @@ class Dante(pygame.sprite.Sprite):
         for g in groups:
             g.add(self)
 
+        self.bank = AnimationBank(assets, (DANTE_WALK, DANTE_DIE, DANTE_HURT, DANTE_ATTACK))
         self.walk_frames = assets[DANTE_WALK]
         self.attack_frames = assets.get('dante_attack', [])
         self.is_attacking = False
@@ -54,8 +55,8 @@ class Dante(pygame.sprite.Sprite):
         self.frame_timer = 0
         self.frame_delay = 200
 
-        self.walk_right = self.walk_frames
-        self.walk_left = [pygame.transform.flip(f, True, False) for f in self.walk_frames]
+        self.walk_right = self.bank.frames(DANTE_WALK, 1)
+        self.walk_left = self.bank.frames(DANTE_WALK, -1)
 
         idx = self.anim['idle'][0]
         self.image = self.walk_right[idx]
@@ -104,9 +105,7 @@ class Dante(pygame.sprite.Sprite):
                     self.is_hurt = False
                     if self.lives <= 0:
                         self.morrer()
-            new_image = self.hurt_frames[self.frame_index]
-            if self.facing == -1:
-                new_image = pygame.transform.flip(new_image, True, False)
+            new_image = self.bank.frame(DANTE_HURT, self.facing, self.frame_index)
             anchor = self.rect.midbottom
             self.image = new_image
             self.rect = self.image.get_rect()
@@ -142,17 +141,13 @@ class Dante(pygame.sprite.Sprite):
                     self.frame_index = len(self.die_frames) - 1
                     self.is_dying = False
                     self.die_played = True
-                    new_image = self.die_frames[self.frame_index]
-                    if self.facing == -1:
-                        new_image = pygame.transform.flip(new_image, True, False)
+                    new_image = self.bank.frame(DANTE_DIE, self.facing, self.frame_index)
                     anchor = self.rect.midbottom
                     self.image = new_image
                     self.rect = self.image.get_rect()
                     self.rect.midbottom = anchor
             if self.frame_index < len(self.die_frames):
-                new_image = self.die_frames[self.frame_index]
-                if self.facing == -1:
-                    new_image = pygame.transform.flip(new_image, True, False)
+                new_image = self.bank.frame(DANTE_DIE, self.facing, self.frame_index)
                 anchor = self.rect.midbottom
                 self.image = new_image
                 self.rect = self.image.get_rect()
@@ -182,9 +177,7 @@ class Dante(pygame.sprite.Sprite):
                 if self.attack_frame_index >= len(self.attack_frames):
                     self.is_attacking = False
                     self.attack_frame_index = 0
-            af = self.attack_frames[min(self.attack_frame_index, len(self.attack_frames)-1)]
-            if self.facing == -1:
-                af = pygame.transform.flip(af, True, False)
+            af = self.bank.frame(DANTE_ATTACK, self.facing, min(self.attack_frame_index, len(self.attack_frames)-1))
             anchor = self.rect.midbottom
             self.image = af
             self.rect = self.image.get_rect()
@@ -298,12 +291,14 @@ class Dante(pygame.sprite.Sprite):
         if self.hp <= 0:
             self.morrer()
 
-    def attack(self, enemies_group):
+    def attack(self, enemies_group, grid=None):
         """
         Realiza o ataque de Dante, causando dano aos inimigos próximos.
 
         Parâmetros:
             enemies_group (pygame.sprite.Group): Grupo de inimigos a serem verificados.
+            grid (broadphase.SpatialHash ou None): grade de colisão; com ela só os
+                inimigos perto do alcance do ataque são verificados.
 
         Retorna:
             None
@@ -315,7 +310,11 @@ class Dante(pygame.sprite.Sprite):
             self.attack_frame_index = 0
             self.attack_timer = 0
 
-        for e in enemies_group:
+        if grid is not None:
+            near = [e for e in grid.query_circle(self.rect.center, self.attack_range) if e in enemies_group]
+        else:
+            near = enemies_group
+        for e in near:
             dx = e.rect.centerx - self.rect.centerx
             dy = e.rect.centery - self.rect.centery
             dist = (dx*dx + dy*dy) ** 0.5
@@ -10,10 +10,70 @@ IMG_DIR = path.join(path.dirname(__file__), 'assets', 'imagens')
 FPS = 60
 GRAVIDADE = 1
 
+# Simulação em passo fixo (timestep.py): a lógica do jogo sempre avança SIM_STEP ms por
+# passo (as velocidades foram ajustadas para 60 passos por segundo), no máximo
+# MAX_SIM_STEPS passos por frame; o tempo que passar disso é descartado (o jogo fica
+# mais lento em vez de travar). A tela de jogo desenha até RENDER_FPS quadros por
+# segundo (0 = sem limite), interpolando as posições entre os dois últimos passos
+SIM_STEP = 1000.0 / 60
+MAX_SIM_STEPS = 5
+RENDER_FPS = FPS
+
 #Pasta que contem os sons
 
 SND_DIR = path.join(path.dirname(__file__), 'assets', 'sounds')
 
+# Pacote pré-processado de imagens (gerado com: python asset_pack.py)
+PACK_PATH = path.join(path.dirname(__file__), 'assets', 'assets.pack')
+ATLAS_MAX_SIZE = 2048  # lado máximo (px) de cada página de atlas do pacote
+
+# Threads usadas para decodificar imagens sem pacote (0 = carregamento serial)
+ASSET_LOAD_WORKERS = 4
+
+# Processos usados pelas lutas de balanceamento (balanceamento.py); 0 = um por núcleo
+BALANCE_WORKERS = 0
+
+# Orçamento (bytes) do cache LRU das animações dos bosses carregadas sob demanda
+ASSET_CACHE_BUDGET = 8 * 1024 * 1024
+
+# Modo do loader: True guarda só as imagens no tamanho em que aparecem na tela (a
+# imagem original do ícone e a coxa em tamanho cheio não ficam na memória)
+ASSET_DISPLAY_SIZES_ONLY = True
+
+# Desenho da tela de jogo: 'dirty' atualiza só as áreas que mudaram
+# (pygame.display.update(rects)); 'full' redesenha e envia a tela inteira
+RENDER_MODE = 'dirty'
+
+# Resolução interna da tela de jogo: a cena é desenhada nesse tamanho e ampliada para
+# a janela (LARGURA x ALTURA). Valores menores aliviam máquinas fracas, ex.: (960, 540)
+# ou (640, 360); a lógica do jogo continua nas coordenadas da janela
+RENDER_SIZE = (LARGURA, ALTURA)
+
+# Superfícies com transparência recebem RLEACCEL (surfaces.py): blits bem mais rápidos,
+# mas mexer nos pixels depois (fill, set_at) fica mais caro
+SURFACE_RLE = True
+
+# Telas paradas (menu, comandos, game over): tempo máximo (ms) esperando eventos
+# antes de conferir a tela de novo; sem eventos, elas não redesenham nada
+IDLE_TIMEOUT = 1000
+
+# Quantos textos renderizados ficam guardados no cache de textos (fonts.py)
+TEXT_CACHE_SIZE = 256
+
+# Lado (px) das células da grade de colisão do combate (broadphase.py); bem maior que
+# um projétil e da ordem do tamanho de um boss
+BROADPHASE_CELL = 128
+# Pools de projéteis com menos que isso não ganham índice na grade: testar todos de
+# uma vez com o NumPy sai mais barato que ordenar por célula
+BROADPHASE_MIN_POOL = 1024
+
+# Orçamento de memória de pixels de todas as superfícies do jogo (bytes); acima disso
+# o relatório de memória (memory.py) avisa
+SURFACE_MEMORY_BUDGET = 64 * 1024 * 1024
+
+# Quantas animações pré-carregadas da próxima sala são convertidas por frame
+PREFETCH_CONVERTS_PER_FRAME = 2
+
 
 #Controle de fluxos
 
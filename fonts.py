@@ -0,0 +1,61 @@
+# fonts.py
+# Fontes e textos renderizados compartilhados por todas as telas do jogo.
+from collections import OrderedDict
+import pygame
+from config import TEXT_CACHE_SIZE
+from surfaces import prepare_surface
+
+# (família, tamanho, negrito, itálico) -> pygame.font.Font, resolvida uma vez por processo
+_fonts = {}
+
+# (texto, fonte, cor, antialias) -> superfície renderizada, em ordem de uso (LRU)
+_texts = OrderedDict()
+
+
+def get_font(family, size, bold=False, italic=False):
+    """
+    Retorna uma fonte do sistema, procurando-a (SysFont) só na primeira vez.
+
+    Recebe:
+        family (str ou None): nome da família (None = fonte padrão do pygame).
+        size (int): tamanho.
+        bold (bool): negrito.
+        italic (bool): itálico.
+
+    Retorna:
+        pygame.font.Font
+    """
+    key = (family, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(family, size, bold=bold, italic=italic)
+        _fonts[key] = font
+    return font
+
+
+def render_text(text, color, family, size, bold=False, italic=False, antialias=True):
+    """
+    Retorna o texto renderizado, reaproveitando a superfície se ele já foi renderizado.
+
+    A superfície é compartilhada: quem precisar alterá-la deve fazer uma cópia. Ela já
+    vem no formato da tela (surfaces.prepare_surface).
+
+    Recebe:
+        text (str): texto.
+        color (tuple): cor do texto.
+        family, size, bold, italic: fonte (ver get_font).
+        antialias (bool): suavização.
+
+    Retorna:
+        pygame.Surface
+    """
+    key = (text, (family, size, bold, italic), tuple(color), antialias)
+    surf = _texts.get(key)
+    if surf is not None:
+        _texts.move_to_end(key)
+        return surf
+    surf = prepare_surface(get_font(family, size, bold, italic).render(text, antialias, color))
+    _texts[key] = surf
+    if len(_texts) > TEXT_CACHE_SIZE:
+        _texts.popitem(last=False)
+    return surf
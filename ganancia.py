@@ -4,6 +4,26 @@ import pygame
 import random
 from classes import Dante
 from config import LARGURA, ALTURA, FPS
+from assets import GANANCIA_IDLE, GANANCIA_ATTACK, GANANCIA_DIE, AnimationBank
+from surfaces import prepare_surface
+from projeteis import ProjectilePool
+
+_coin_image = None  # moeda desenhada uma vez só e compartilhada por todas as instâncias
+
+
+def coin_image():
+    """
+    Retorna a imagem da moeda atirada pela Ganância (desenhada na primeira chamada).
+
+    Retorna:
+        pygame.Surface
+    """
+    global _coin_image
+    if _coin_image is None:
+        img = pygame.Surface((16, 16), pygame.SRCALPHA)
+        pygame.draw.circle(img, (255, 215, 0), (8, 8), 8)  # moeda dourada simples
+        _coin_image = prepare_surface(img)
+    return _coin_image
 
 class BossGanancia(pygame.sprite.Sprite):
     """
@@ -12,7 +32,7 @@ class BossGanancia(pygame.sprite.Sprite):
     e possui animações de idle, ataque e morte.
     """
     
-    def __init__(self, x, y, assets=None, groups=None):
+    def __init__(self, x, y, assets=None, groups=None, hp=300, damage=10, shoot_delay=2500):
         """
         Inicializa o Boss Ganância com sua posição inicial, sprites e configurações.
         
@@ -21,13 +41,16 @@ class BossGanancia(pygame.sprite.Sprite):
             y (int): Posição Y inicial do boss
             assets (dict): Dicionário contendo os frames de animação do boss
             groups (iterable): Grupos de sprites aos quais o boss deve ser adicionado
+            hp (int): Vida base do boss (padrão: 300)
+            damage (int): Dano do boss; cada moeda causa metade (padrão: 10)
+            shoot_delay (int): ms entre disparos de moedas (padrão: 2500)
         
         Faz:
             - Inicializa o sprite base do Pygame
             - Adiciona o boss aos grupos fornecidos
             - Define HP base, dano e estado inicial
             - Carrega os frames de animação dos assets
-            - Cria a imagem de projétil (moeda dourada)
+            - Usa a imagem de projétil compartilhada (moeda dourada)
             - Define limites de movimento e posição alvo aleatória
             - Inicializa variáveis de animação e controle
         
@@ -45,25 +68,26 @@ class BossGanancia(pygame.sprite.Sprite):
             except Exception:
                 pass
 
-        self.base_hp = 300
+        self.base_hp = int(hp)
         self.hp = self.base_hp
         self.alive_flag = True
-        self.damage = 10
+        self.damage = int(damage)
 
+        self.bank = AnimationBank(assets, (GANANCIA_IDLE, GANANCIA_ATTACK, GANANCIA_DIE))
         self.idle_frames = assets.get('ganancia_idle', [])
         self.attack_frames = assets.get('ganancia_attack', [])
         self.die_frames = assets.get('ganancia_die', [])
 
         self.state = 'idle'
-        self.image = self.idle_frames[0] if self.idle_frames else pygame.Surface([50, 50])
+        self.image = self.idle_frames[0] if self.idle_frames else prepare_surface(pygame.Surface([50, 50]))
         self.rect = self.image.get_rect(midbottom=(x, y))
 
-        self.projectiles = []
-        self.shoot_delay = 2500  # ms entre disparos
+        self.shoot_delay = shoot_delay  # ms entre disparos
         self.shoot_timer = 0
-        self.projectile_speed = 5
-        self.projectile_img = pygame.Surface((16, 16), pygame.SRCALPHA)
-        pygame.draw.circle(self.projectile_img, (255, 215, 0), (8, 8), 8)  # moeda dourada simples
+        self.projectile_speed = 5  # px por quadro a FPS quadros por segundo
+        self.projectile_img = coin_image()
+        # moedas em voo (arrays do NumPy, posições com fração)
+        self.projectiles = ProjectilePool([self.projectile_img])
 
         self.speed = 2.0
         self.max_x = LARGURA - 100
@@ -148,7 +172,7 @@ class BossGanancia(pygame.sprite.Sprite):
             - Seleciona os frames corretos baseado no estado (dying, attack ou idle)
             - Avança para o próximo frame quando o delay é atingido
             - Gerencia o fim das animações (morte para no último frame, ataque volta ao idle, idle faz loop)
-            - Aplica flip horizontal na sprite se o boss estiver olhando para a esquerda
+            - Usa o frame já virado para o lado em que o boss está olhando (banco de animações)
             - Atualiza a imagem e o rect mantendo a posição central
         
         Retorna:
@@ -158,11 +182,11 @@ class BossGanancia(pygame.sprite.Sprite):
         
         frames = []
         if self.is_dying:
-            frames = self.die_frames
+            frames = self.bank.frames(GANANCIA_DIE, self.facing)
         elif self.state == 'attack':
-            frames = self.attack_frames
+            frames = self.bank.frames(GANANCIA_ATTACK, self.facing)
         elif self.state == 'idle':
-            frames = self.idle_frames
+            frames = self.bank.frames(GANANCIA_IDLE, self.facing)
 
         if not frames:
             return
@@ -184,9 +208,7 @@ class BossGanancia(pygame.sprite.Sprite):
         self.frame_index = min(self.frame_index, len(frames) - 1)
         
         new_image = frames[self.frame_index]
-        if self.facing == -1:
-            new_image = pygame.transform.flip(new_image, True, False)
-        
+
         anchor = self.rect.center
         self.image = new_image
         self.rect = self.image.get_rect(center=anchor)
@@ -209,8 +231,7 @@ class BossGanancia(pygame.sprite.Sprite):
             - Gerencia o timer de disparo de projéteis
             - Cria novos projéteis (moedas) direcionados ao jogador a cada intervalo
             - Atualiza a posição de todos os projéteis ativos
-            - Remove projéteis que expiraram ou colidiram com o jogador
-            - Aplica dano ao jogador quando um projétil o atinge
+            - Remove projéteis que expiraram (a colisão com o jogador fica na simulação)
         
         Retorna:
             Nada (void)
@@ -251,10 +272,10 @@ class BossGanancia(pygame.sprite.Sprite):
                 dx = player.rect.centerx - self.rect.centerx
                 dy = player.rect.centery - self.rect.centery
                 dist = max(1, (dx ** 2 + dy ** 2) ** 0.5)
-                vx = self.projectile_speed * dx / dist
-                vy = self.projectile_speed * dy / dist
+                speed = self.projectile_speed * FPS  # px por segundo
                 rect = self.projectile_img.get_rect(center=self.rect.center)
-                self.projectiles.append({'rect': rect, 'vx': vx, 'vy': vy, 'life': 4000})
+                self.projectiles.spawn(rect.x, rect.y, rect.w, rect.h, speed * dx / dist,
+                                       speed * dy / dist, life=4000, damage=self.damage // 2)
 
 
 
@@ -264,33 +285,23 @@ class BossGanancia(pygame.sprite.Sprite):
             pass
 
         
-        # Atualiza projéteis
-        for p in list(self.projectiles):
-            p['rect'].x += p['vx']
-            p['rect'].y += p['vy']
-            p['life'] -= dt
-            if p['life'] <= 0:
-                self.projectiles.remove(p)
-            elif 'player' in kwargs and p['rect'].colliderect(kwargs['player'].rect):
-                kwargs['player'].dano(amount=self.damage // 2)
-                try:
-                    self.projectiles.remove(p)
-                except ValueError:
-                    pass
+        # Atualiza projéteis (todos de uma vez); o dano em Dante é aplicado pela
+        # simulação, que testa as moedas na grade de colisão
+        self.projectiles.step(dt)
 
-    def draw_traces(self, surface):
+    def draw_traces(self, surface, alpha=1.0):
         """
         Desenha todos os projéteis do boss na tela.
         
         Recebe:
             surface (pygame.Surface): Superfície do Pygame onde os projéteis serão desenhados
+            alpha (float): fração do passo da simulação já decorrida, para interpolar a
+                posição (1.0 = posição atual)
         
         Faz:
-            - Itera por todos os projéteis ativos na lista
-            - Desenha (blit) cada imagem de projétil na sua posição atual
+            - Desenha todas as moedas ativas com um único blits()
         
         Retorna:
             Nada (void)
         """
-        for p in self.projectiles:
-            surface.blit(self.projectile_img, p['rect'])
\ No newline at end of file
+        self.projectiles.draw(surface, alpha)
\ No newline at end of file
@@ -1,9 +1,13 @@
 import pygame
 import random
 import math
+import weakref
+from assets import GULA_IDLE, GULA_WALK, GULA_ATTACK, GULA_DIE, GULA_COXA, AnimationBank, scaled_image
+from surfaces import prepare_surface
+from projeteis import ProjectilePool
 
 # ===== CONFIGURAÇÕES DOS TIROS (COXAS) =====
-COXA_DAMAGE = 10
+COXA_DAMAGE = 18
 COXA_SPEED = 300  # pixels por segundo (velocidade do tiro)
 COXA_WIDTH = 40
 COXA_HEIGHT = 20
@@ -13,9 +17,42 @@ COXA_SHOOT_DELAY = 3000  # ms entre cada tiro ← CONTROLE AQUI O DELAY
 SPEED_SCALE = 0.90
 ATTACK_ANIM_DELAY = 100
 
+# coxas prontas para os dois lados, compartilhadas por todas as instâncias da Gula:
+# imagem da coxa -> {-1: esquerda, 1: direita}
+_coxa_sides = weakref.WeakKeyDictionary()
+_fallback_coxa = None
+
+
+def coxa_images(coxa):
+    """
+    Retorna a coxa virada para cada lado, espelhando a imagem uma vez só.
+
+    Recebe:
+        coxa (pygame.Surface ou None): coxa no tamanho do tiro (aponta para a esquerda);
+                                       None usa uma elipse laranja no lugar.
+
+    Retorna:
+        dict: {-1: imagem para a esquerda, 1: imagem para a direita}
+    """
+    global _fallback_coxa
+    if not coxa:
+        if _fallback_coxa is None:
+            temp_w = 50
+            temp_h = 20
+            coxa_img = pygame.Surface((temp_w, temp_h), pygame.SRCALPHA)
+            pygame.draw.ellipse(coxa_img, (230, 120, 20), (0, 0, temp_w, temp_h))
+            _fallback_coxa = prepare_surface(pygame.transform.scale(coxa_img, (COXA_WIDTH, COXA_HEIGHT)))
+        coxa = _fallback_coxa
+    sides = _coxa_sides.get(coxa)
+    if sides is None:
+        sides = {-1: coxa, 1: prepare_surface(pygame.transform.flip(coxa, True, False))}
+        _coxa_sides[coxa] = sides
+    return sides
+
 
 class BossGula(pygame.sprite.Sprite):
-    def __init__(self, x, y, assets, hp=420, damage=16, patrol_min_x=100, patrol_max_x=None, speed=2):
+    def __init__(self, x, y, assets, hp=420, damage=COXA_DAMAGE, patrol_min_x=100, patrol_max_x=None, speed=2,
+                 shoot_delay=COXA_SHOOT_DELAY):
         """
         Inicializa o chefe 'Gula', configurando sprites, atributos de movimento e combate.
 
@@ -24,36 +61,38 @@ class BossGula(pygame.sprite.Sprite):
             y (int): Posição vertical inicial.
             assets (dict): Dicionário contendo sprites e imagens.
             hp (int): Vida total do chefe.
-            damage (int): Dano causado ao jogador.
+            damage (int): Dano de cada coxa (padrão: COXA_DAMAGE).
             patrol_min_x (int): Limite esquerdo de movimentação.
             patrol_max_x (int): Limite direito de movimentação.
             speed (float): Velocidade de deslocamento.
+            shoot_delay (int): ms entre cada tiro de coxa (padrão: COXA_SHOOT_DELAY).
 
         Retorna:
             None
         """
         super().__init__()
 
+        self.bank = AnimationBank(assets, (GULA_IDLE, GULA_WALK, GULA_ATTACK, GULA_DIE))
         self.idle_frames = assets.get('gula_idle', []) if assets else []
         self.walk_frames = assets.get('gula_walk', []) if assets else []
         self.attack_frames = assets.get('gula_attack', []) if assets else []
         self.die_frames = assets.get('gula_die', []) if assets else []
 
-        self.die_right = list(self.die_frames)
-        self.die_left = [pygame.transform.flip(f, True, False) for f in self.die_right] if self.die_right else []
-
-        self.coxa_img = assets.get('gula_coxa') if assets else None
-        if not self.coxa_img:
-            temp_w = 50
-            temp_h = 20
-            self.coxa_img = pygame.Surface((temp_w, temp_h), pygame.SRCALPHA)
-            pygame.draw.ellipse(self.coxa_img, (230, 120, 20), (0, 0, temp_w, temp_h))
+        self.die_right = self.bank.frames(GULA_DIE, 1)
+        self.die_left = self.bank.frames(GULA_DIE, -1)
 
-        self.coxa_weapon = pygame.transform.scale(self.coxa_img, (COXA_WIDTH, COXA_HEIGHT))
+        # coxa já no tamanho do tiro (o registro guarda só o resultado redimensionado)
+        # coxa já virada para cada lado (a imagem original aponta para a esquerda),
+        # compartilhada entre as instâncias em vez de copiada
+        self.coxa_by_facing = coxa_images(scaled_image(assets, GULA_COXA, (COXA_WIDTH, COXA_HEIGHT)) if assets else None)
+        self.coxa_weapon = self.coxa_by_facing[-1]
+        # coxas em voo (arrays do NumPy); a imagem 0 aponta para a esquerda e a 1 para a direita
+        self.coxas = ProjectilePool([self.coxa_by_facing[-1], self.coxa_by_facing[1]])
         self.facing = -1
         self.image = self.idle_frames[0] if self.idle_frames else pygame.Surface((180, 180), pygame.SRCALPHA)
         if not self.idle_frames and not self.walk_frames:
             self.image.fill((0, 150, 0))
+            self.image = prepare_surface(self.image)
         self.rect = self.image.get_rect(midbottom=(x, y))
         self.hp = int(hp)
         self.base_hp = int(hp)
@@ -62,6 +101,7 @@ class BossGula(pygame.sprite.Sprite):
         self.patrol_min_x = patrol_min_x
         self.patrol_max_x = patrol_max_x
         self.speed = float(speed)
+        self.shoot_delay = shoot_delay
         self.state = "idle"
         self.frame_idx = 0
         self.frame_timer = 0
@@ -74,7 +114,6 @@ class BossGula(pygame.sprite.Sprite):
         self.die_index = 0
         self.die_timer = 0
         self.die_delay = 120
-        self.coxas = []
         self.atacando = False
 
     def take_damage(self, amount):
@@ -94,7 +133,7 @@ class BossGula(pygame.sprite.Sprite):
             self.is_dying = True
             self.die_index = 0
             self.die_timer = 0
-            self.coxas = []
+            self.coxas.clear()
 
     def atirar_coxa(self):
         """
@@ -106,22 +145,12 @@ class BossGula(pygame.sprite.Sprite):
         Retorna:
             None
         """
-        img = self.coxa_weapon.copy()
-        if self.facing == 1:
-            img = pygame.transform.flip(img, True, False)
+        img = self.coxa_by_facing[self.facing]
         w, h = img.get_size()
         sx = self.rect.right + 10 if self.facing == 1 else self.rect.left - w - 10
         sy = self.rect.centery - h // 2
-        rect = pygame.Rect(sx, sy, w, h)
-        vel = COXA_SPEED * self.facing
-        proj = {
-            'rect': rect,
-            'vel': vel,
-            'image': img,
-            'lifetime': COXA_LIFETIME,
-            'damage': COXA_DAMAGE
-        }
-        self.coxas.append(proj)
+        self.coxas.spawn(sx, sy, w, h, vx=COXA_SPEED * self.facing, life=COXA_LIFETIME,
+                         damage=self.damage, image=0 if self.facing == -1 else 1)
         self.atacando = True
         self.attack_anim_idx = 0
         self.attack_anim_timer = 0
@@ -137,50 +166,41 @@ class BossGula(pygame.sprite.Sprite):
         Retorna:
             None
         """
-        if not self.coxas:
-            return
-        to_remove = []
-        for p in self.coxas:
-            dx = int(p['vel'] * (dt / 1000.0))
-            p['rect'].x += dx
-            p['lifetime'] -= dt
-            if p['lifetime'] <= 0 or p['rect'].right < 0 or (window_width and p['rect'].left > window_width):
-                to_remove.append(p)
-        for p in to_remove:
-            self.coxas.remove(p)
-
-    def draw_traces(self, surface):
+        self.coxas.step(dt, min_x=0, max_x=window_width or None)
+
+    def draw_traces(self, surface, alpha=1.0):
         """
         Desenha os projéteis (coxas) na tela.
 
         Parâmetros:
             surface (pygame.Surface): Superfície onde os projéteis serão desenhados.
+            alpha (float): fração do passo da simulação já decorrida, para interpolar a
+                posição (1.0 = posição atual).
 
         Retorna:
             None
         """
-        for p in self.coxas:
-            surface.blit(p['image'], p['rect'])
+        self.coxas.draw(surface, alpha)
 
-    def _select_frame_and_apply_flip(self, base_frames, dt):
+    def _select_frame(self, key, dt):
         """
-        Seleciona o frame de animação apropriado e aplica flip se necessário.
+        Avança a animação e seleciona o frame já virado para o lado do chefe.
 
         Parâmetros:
-            base_frames (list): Lista de frames da animação.
+            key (str): Chave da animação no banco de animações.
             dt (float): Tempo decorrido desde o último frame (ms).
 
         Retorna:
-            pygame.Surface: Frame de animação ajustado.
+            pygame.Surface: Frame de animação (ou None se a animação não existir).
         """
-        if not base_frames:
+        frames = self.bank.frames(key, self.facing)
+        if not frames:
             return None
         self.frame_timer += dt
         if self.frame_timer >= self.frame_delay:
             self.frame_timer -= self.frame_delay
-            self.frame_idx = (self.frame_idx + 1) % len(base_frames)
-        frame = base_frames[self.frame_idx]
-        return pygame.transform.flip(frame, True, False) if self.facing == 1 else frame
+            self.frame_idx = (self.frame_idx + 1) % len(frames)
+        return frames[self.frame_idx]
 
     def update(self, dt, window_width=None, ground_y=None, player=None):
         """
@@ -239,18 +259,18 @@ class BossGula(pygame.sprite.Sprite):
             else:
                 self.state = "idle"
                 self.shoot_timer += dt
-                if self.shoot_timer >= COXA_SHOOT_DELAY:
+                if self.shoot_timer >= self.shoot_delay:
                     self.shoot_timer = 0
                     self.atirar_coxa()
         else:
             self.state = "idle"
             self.shoot_timer = 0
 
-        base = self.walk_frames if self.state == "walk" else self.idle_frames
-        if base and self.frame_idx >= len(base):
+        base = GULA_WALK if self.state == "walk" else GULA_IDLE
+        if self.frame_idx >= len(self.bank.frames(base, self.facing)):
             self.frame_idx = 0
             self.frame_timer = 0
-        frame_to_draw = self._select_frame_and_apply_flip(base, dt)
+        frame_to_draw = self._select_frame(base, dt)
         if frame_to_draw:
             anchor = self.rect.midbottom
             self.image = frame_to_draw
@@ -266,10 +286,7 @@ class BossGula(pygame.sprite.Sprite):
                     self.attack_anim_idx += 1
                 if self.attack_anim_idx < len(frames_attack):
                     anchor = self.rect.midbottom
-                    attack_frame = frames_attack[self.attack_anim_idx]
-                    if self.facing == 1:
-                        attack_frame = pygame.transform.flip(attack_frame, True, False)
-                    self.image = attack_frame
+                    self.image = self.bank.frame(GULA_ATTACK, self.facing, self.attack_anim_idx)
                     self.rect = self.image.get_rect()
                     self.rect.midbottom = anchor
             else:
@@ -0,0 +1,109 @@
+# hud.py
+# HUD da tela de jogo (corações do Dante e barra de vida do boss) com cache.
+import pygame
+from config import LARGURA
+from fonts import render_text
+from surfaces import prepare_surface
+
+HEART_COLOR = (220, 20, 60)
+HEART_FONT = ("Bookman Old Style", 40)
+BAR_W = 420
+BAR_H = 18
+MARGIN_TOP = 8
+
+
+class Hud:
+    """
+    Desenha os corações e a barra de vida do boss reaproveitando superfícies prontas.
+
+    Os textos vêm do cache de textos (fonts.py). Os textos e a barra só são montados
+    de novo quando o valor mostrado muda (vidas, hp, base_hp ou boss); nos outros
+    frames o HUD é só alguns blits de superfícies já prontas.
+    """
+
+    def __init__(self, heart_color=HEART_COLOR):
+        """
+        Recebe:
+            heart_color (tuple): cor dos corações.
+
+        Retorna:
+            None
+        """
+        self.heart_color = heart_color
+
+        self.x = (LARGURA - BAR_W) // 2
+        self.y = MARGIN_TOP
+        self.panel_rect = pygame.Rect(self.x - 4, self.y - 6, BAR_W + 8, BAR_H + 28)
+        self.panel = pygame.Surface(self.panel_rect.size, pygame.SRCALPHA)
+        self.panel.fill((10, 10, 10, 180))
+        self.panel = prepare_surface(self.panel)
+
+        self._name = None          # nome do boss renderizado
+        self._name_surf = None
+        self._bar_key = None       # (hp, base_hp) da barra renderizada
+        self._bar_surf = None
+        self._lives = None         # vidas dos corações renderizados
+        self._hearts_surf = None
+
+    def _boss_name(self, name):
+        # renderiza o nome só quando o boss muda
+        if name != self._name:
+            self._name = name
+            self._name_surf = render_text(name, (230, 230, 230), None, 28)
+        return self._name_surf
+
+    def _boss_bar(self, hp, base_hp):
+        """
+        Retorna a barra de vida (fundo, vida, borda e texto "hp/base_hp") numa única
+        superfície, refeita só quando hp ou base_hp mudam.
+
+        Recebe:
+            hp (int): vida atual do boss.
+            base_hp (int): vida base do boss.
+
+        Retorna:
+            pygame.Surface
+        """
+        key = (hp, base_hp)
+        if key != self._bar_key:
+            self._bar_key = key
+            bar = pygame.Surface((BAR_W, BAR_H)).convert()
+            hp_pct = max(0.0, hp) / max(1, base_hp)
+            bar.fill((60, 60, 60))
+            pygame.draw.rect(bar, (200, 40, 40), (0, 0, int(BAR_W * hp_pct), BAR_H))
+            pygame.draw.rect(bar, (20, 20, 20), bar.get_rect(), 2)
+            hp_surf = render_text(f"{hp}/{base_hp}", (255, 255, 255), None, 26, bold=True)
+            bar.blit(hp_surf, hp_surf.get_rect(center=(BAR_W // 2, BAR_H // 2)))
+            self._bar_surf = bar
+        return self._bar_surf
+
+    def _hearts(self, lives):
+        # renderiza a linha de corações só quando o número de vidas muda
+        if lives != self._lives:
+            self._lives = lives
+            hearts = "♥ " * max(0, lives)
+            self._hearts_surf = render_text(hearts, self.heart_color, *HEART_FONT) if hearts else None
+        return self._hearts_surf
+
+    def draw(self, target, boss, boss_name, lives):
+        """
+        Desenha o HUD.
+
+        Recebe:
+            target: janela ou DirtyRenderer (qualquer coisa com blit()).
+            boss: boss atual (com hp e base_hp) ou None.
+            boss_name (str): nome mostrado acima da barra.
+            lives (int): vidas do Dante.
+
+        Retorna:
+            None
+        """
+        if boss is not None:
+            target.blit(self.panel, self.panel_rect)
+            name_surf = self._boss_name(boss_name)
+            target.blit(name_surf, (self.x + (BAR_W - name_surf.get_width()) // 2, self.y - 2))
+            target.blit(self._boss_bar(boss.hp, boss.base_hp), (self.x, self.y + 18))
+
+        hearts_surf = self._hearts(lives)
+        if hearts_surf is not None:
+            target.blit(hearts_surf, (10, 10))
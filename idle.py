@@ -0,0 +1,61 @@
+# idle.py
+# Espera por eventos com pouco uso de CPU para as telas paradas (menu, comandos, game over).
+import pygame
+from config import IDLE_TIMEOUT
+
+# eventos que pedem para redesenhar a tela mesmo sem nada ter mudado no jogo
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWFOCUSGAINED,
+                 pygame.WINDOWRESTORED, pygame.WINDOWSHOWN)
+
+
+class IdleWaiter:
+    """
+    Substitui o laço a 60 FPS das telas estáticas por uma espera bloqueante.
+
+    O que faz:
+        - wait() dorme em pygame.event.wait até chegar um evento ou até o próximo
+          momento em que a tela precisa mudar (ex.: piscada de um texto).
+        - Quando a janela perde o foco, a tela fica pausada: a música pausa e a espera
+          não tem limite de tempo, até a janela receber o foco de novo.
+    """
+
+    def __init__(self):
+        self.paused = False
+
+    def wait(self, timeout=IDLE_TIMEOUT):
+        """
+        Espera pelo próximo evento e devolve todos os eventos pendentes.
+
+        Recebe:
+            timeout (int ou None): máximo de ms a esperar (None = IDLE_TIMEOUT).
+
+        Retorna:
+            list: eventos recebidos (vazia se o tempo acabou sem eventos).
+        """
+        if self.paused:
+            event = pygame.event.wait()
+        else:
+            event = pygame.event.wait(max(1, int(timeout if timeout is not None else IDLE_TIMEOUT)))
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        for e in events:
+            if e.type == pygame.WINDOWFOCUSLOST and not self.paused:
+                self.paused = True
+                pygame.mixer.music.pause()
+            elif e.type == pygame.WINDOWFOCUSGAINED and self.paused:
+                self.paused = False
+                pygame.mixer.music.unpause()
+        return events
+
+    @staticmethod
+    def needs_redraw(events):
+        """
+        Diz se algum evento pede para redesenhar a tela (janela exposta, restaurada...).
+
+        Recebe:
+            events (list): eventos recebidos.
+
+        Retorna:
+            bool
+        """
+        return any(e.type in REDRAW_EVENTS for e in events)
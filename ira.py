@@ -1,5 +1,9 @@
 import pygame
 import random
+import numpy as np
+from assets import IRA_IDLE, IRA_ATTACK, IRA_DIE, AnimationBank
+from surfaces import prepare_surface
+from projeteis import ProjectilePool
 
 BOSS_ATTACK_INTERVAL = 2000   # ms entre ataques (padrão)
 TRACE_COUNT = 16               # quantos traços por ataque
@@ -9,10 +13,44 @@ FURY_MULT = 1.5               # multiplicador quando o boss entra em fúria
 TRACE_WIDTH = 100
 TRACE_HEIGHT = 18
 TRACE_MARGIN_BOTTOM = 10      # distância entre o traço e o "chão" (px)
+TRACE_PAD_X = 10              # hitbox do traço menor que o desenho (px de cada lado)
+TRACE_PAD_Y = 4
 ATTACK_ANIM_DELAY = 120       # ms entre frames de animação de ataque
+TRACE_BLINK_PERIOD = 120      # ms de cada piscada do traço em alerta
+TRACE_ALPHA_STEPS = 8         # quantos níveis de alpha o traço em alerta usa ao piscar
+TRACE_WARN_COLOR = (255, 90, 60)
+TRACE_ACTIVE_COLOR = (255, 60, 60, 200)
+
+# superfícies dos traços já pintadas: (tamanho, cor RGBA) -> pygame.Surface
+_trace_surfaces = {}
+
+def _trace_surface(size, color):
+    """
+    Retorna a superfície de um traço com a cor pedida, pintada uma vez só e
+    compartilhada por todos os traços do mesmo tamanho.
+
+    Recebe:
+        size (tuple): (largura, altura) do traço.
+        color (tuple): cor RGBA.
+
+    Retorna:
+        pygame.Surface
+    """
+    key = (tuple(size), tuple(color))
+    surf = _trace_surfaces.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(color)
+        surf = prepare_surface(surf)
+        _trace_surfaces[key] = surf
+    return surf
+
+def _warn_alpha(step):
+    # alpha do traço em alerta no degrau `step` da piscada (vai de 140 até perto de 220)
+    return 140 + int(80 * (step / TRACE_ALPHA_STEPS))
 
 class BossIra(pygame.sprite.Sprite):
-    def __init__(self, x, y, assets, hp=500, damage=18):
+    def __init__(self, x, y, assets, hp=500, damage=18, clock=None, trace_count=TRACE_COUNT, fury_mult=FURY_MULT):
         """
         Inicializa o Boss Ira.
         
@@ -24,25 +62,31 @@ class BossIra(pygame.sprite.Sprite):
             assets (dict): Dicionário contendo as imagens e animações carregadas
             hp (int): Pontos de vida iniciais do boss (padrão: 500)
             damage (int): Dano causado pelos ataques do boss (padrão: 18)
+            clock (callable ou None): relógio em ms usado pelos traços (padrão:
+                                      pygame.time.get_ticks; a simulação passa o seu)
+            trace_count (int): traços por ataque (padrão: TRACE_COUNT)
+            fury_mult (float): multiplicador de HP da fúria (padrão: FURY_MULT)
         
         Retorna: None (é um construtor)
         """
         super().__init__()
+        self.clock = clock if clock is not None else pygame.time.get_ticks
 
         # assets: tenta ler de assets dict; use fallback se faltar
         self.idle_img = assets.get('ira_idle') if assets else None
         self.attack_frames = assets.get('ira_attack', []) if assets else []
         self.die_frames = assets.get('ira_die', []) if assets else []
 
-        # caches espelhados (direita / esquerda)
-        self.attack_frames_right = list(self.attack_frames)
-        self.attack_frames_left = [pygame.transform.flip(f, True, False) for f in self.attack_frames_right]
+        # frames de cada lado (direita / esquerda) vindos do banco de animações
+        self.bank = AnimationBank(assets, (IRA_IDLE, IRA_ATTACK, IRA_DIE))
+        self.attack_frames_right = self.bank.frames(IRA_ATTACK, 1)
+        self.attack_frames_left = self.bank.frames(IRA_ATTACK, -1)
 
-        self.die_frames_right = list(self.die_frames)
-        self.die_frames_left = [pygame.transform.flip(f, True, False) for f in self.die_frames_right]
+        self.die_frames_right = self.bank.frames(IRA_DIE, 1)
+        self.die_frames_left = self.bank.frames(IRA_DIE, -1)
 
         self.idle_right = self.idle_img
-        self.idle_left = pygame.transform.flip(self.idle_img, True, False) if self.idle_img else None
+        self.idle_left = self.bank.frame(IRA_IDLE, -1, 0) if self.idle_img else None
 
         # virado para a esquerda por padrão (muda se quiser)
         self.facing = -1
@@ -55,6 +99,7 @@ class BossIra(pygame.sprite.Sprite):
         else:
             self.image = pygame.Surface((200,200), pygame.SRCALPHA)
             self.image.fill((150,0,0))
+            self.image = prepare_surface(self.image)
 
         self.rect = self.image.get_rect(midbottom=(x, y))
 
@@ -78,11 +123,19 @@ class BossIra(pygame.sprite.Sprite):
         self.die_timer = 0
         self.die_delay = 120  # ms por frame da animação de morte
 
-        # traços no chão: lista de dicts {'rect':Rect, 'warn_until':, 'active_until':}
-        self.traces = []
+        # traços no chão (arrays do NumPy): a hitbox é menor que o desenho; 'arm' é o
+        # tempo de alerta que falta e 'life' o tempo até o traço sumir
+        self.traces = ProjectilePool(capacity=max(16, trace_count),
+                                     draw_offset=(-TRACE_PAD_X, -TRACE_PAD_Y))
+        size = (TRACE_WIDTH, TRACE_HEIGHT)
+        self.trace_warn_images = [_trace_surface(size, TRACE_WARN_COLOR + (_warn_alpha(step),))
+                                  for step in range(TRACE_ALPHA_STEPS)]
+        self.trace_active_image = _trace_surface(size, TRACE_ACTIVE_COLOR)
 
         # fury mode
         self.fury = False
+        self.fury_mult = fury_mult
+        self.trace_count = trace_count
         self.player_attacked_first = None  # None = undecided
         self.assets = assets
 
@@ -98,7 +151,7 @@ class BossIra(pygame.sprite.Sprite):
         """
         if not self.fury:
             self.fury = True
-            self.hp = int(self.hp * FURY_MULT)
+            self.hp = int(self.hp * self.fury_mult)
             # self.damage = int(self.damage * FURY_MULT)
             try:
                 temp = self.image.copy()
@@ -154,43 +207,37 @@ class BossIra(pygame.sprite.Sprite):
             self.is_dying = True
             self.die_index = 0
             self.die_timer = 0
-            self.traces = []  # limpar traços ao iniciar morrer
+            self.traces.clear()  # limpar traços ao iniciar morrer
 
-    def spawn_traces(self, window_width, ground_y, count=TRACE_COUNT):
+    def spawn_traces(self, window_width, ground_y, count=None):
         """
         Gera traços de ataque no chão.
         
         Serve para: Criar múltiplos traços vermelhos em posições aleatórias que causam dano ao jogador.
                     Cada traço tem uma fase de alerta (piscando) seguida de uma fase ativa (causa dano).
+                    Todos os traços do ataque são criados de uma vez nos arrays de self.traces.
         
         Recebe:
             window_width (int): Largura da janela do jogo (para posicionar traços dentro dos limites)
             ground_y (int): Posição Y do chão (para posicionar traços corretamente)
-            count (int): Quantidade de traços a serem gerados (padrão: TRACE_COUNT = 16)
+            count (int ou None): Quantidade de traços a serem gerados (padrão: self.trace_count)
         
-        Retorna: None (adiciona traços à lista self.traces)
+        Retorna: None (substitui os traços de self.traces)
         """
-        self.traces = []
-        now = pygame.time.get_ticks()
-        for i in range(count):
-            w = TRACE_WIDTH
-            h = TRACE_HEIGHT
-            x = random.randint(100, max(100, window_width - 100 - w))
-            y = ground_y - h - TRACE_MARGIN_BOTTOM
-            # hitbox menor que o visual (ajuste pad_x/pad_y conforme preferir)
-            pad_x = 10
-            pad_y = 4
-            hit_rect = pygame.Rect(x + pad_x, y + pad_y, max(4, w - 2*pad_x), max(4, h - 2*pad_y))
-            # opcional: manter também rect visual se quiser desenhar diferente do hit_rect
-            visual_rect = pygame.Rect(x, y, w, h)
-            warn_until = now + TRACE_WARNING_DURATION
-            active_until = warn_until + TRACE_ACTIVE_DURATION
-            self.traces.append({
-                'rect': hit_rect,
-                'visual': visual_rect,
-                'warn_until': warn_until,
-                'active_until': active_until,
-            })
+        if count is None:
+            count = self.trace_count
+        self.traces.clear()
+        if count <= 0:
+            return
+        w = TRACE_WIDTH
+        h = TRACE_HEIGHT
+        xs = [random.randint(100, max(100, window_width - 100 - w)) for _ in range(count)]
+        y = ground_y - h - TRACE_MARGIN_BOTTOM
+        # hitbox menor que o visual (o desenho usa o draw_offset do pool)
+        self.traces.spawn(np.add(xs, TRACE_PAD_X), y + TRACE_PAD_Y,
+                          max(4, w - 2 * TRACE_PAD_X), max(4, h - 2 * TRACE_PAD_Y),
+                          life=TRACE_WARNING_DURATION + TRACE_ACTIVE_DURATION,
+                          arm=TRACE_WARNING_DURATION, damage=self.damage)
 
     def update(self, dt, window_width=None, ground_y=None):
         """
@@ -271,11 +318,10 @@ class BossIra(pygame.sprite.Sprite):
                         self.rect = self.image.get_rect()
                         self.rect.midbottom = anchor
 
-        # limpa traces expiradas (após fase ativa)
-        now = pygame.time.get_ticks()
-        self.traces = [t for t in self.traces if t['active_until'] > now]
+        # desconta o tempo dos traços e limpa os expirados (após fase ativa)
+        self.traces.step(dt)
 
-    def draw_traces(self, surface):
+    def draw_traces(self, surface, alpha=1.0):
         """
         Desenha os traços de ataque na tela.
         
@@ -284,24 +330,19 @@ class BossIra(pygame.sprite.Sprite):
         
         Recebe:
             surface (pygame.Surface): Superfície onde os traços serão desenhados (geralmente a janela do jogo)
+            alpha (float): não usado; os traços ficam parados no chão
         
         Retorna: None (desenha diretamente na surface fornecida)
         """
-        now = pygame.time.get_ticks()
-        for t in self.traces:
-            vr = t.get('visual', t['rect'])
-            # fase warning (pisca)
-            if now < t['warn_until']:
-                blink_period = 120
-                show = ((now // blink_period) % 2) == 0
-                if show:
-                    alpha = 140 + int(80 * ((now % blink_period) / blink_period))
-                    s = pygame.Surface((vr.w, vr.h), pygame.SRCALPHA)
-                    s.fill((255, 90, 60, alpha))
-                    surface.blit(s, (vr.x, vr.y))
-            # fase ativa (sólida)
-            elif now < t['active_until']:
-                s = pygame.Surface((vr.w, vr.h), pygame.SRCALPHA)
-                s.fill((255, 60, 60, 200))
-                surface.blit(s, (vr.x, vr.y))
-            # else: expirada (será limpa no update)
\ No newline at end of file
+        now = self.clock()
+        # degrau de alpha da piscada (igual para todos os traços neste frame)
+        show = ((now // TRACE_BLINK_PERIOD) % 2) == 0
+        step = int((now % TRACE_BLINK_PERIOD) * TRACE_ALPHA_STEPS // TRACE_BLINK_PERIOD)
+        if not self.traces:
+            return
+        warning = self.traces.arm[:len(self.traces)] > 0
+        # fase warning (pisca)
+        if show:
+            self.traces.draw(surface, select=warning, image=self.trace_warn_images[step])
+        # fase ativa (sólida)
+        self.traces.draw(surface, select=~warning, image=self.trace_active_image)
@@ -0,0 +1,187 @@
+# memory.py
+# Contabilidade de memória das superfícies (pixels) carregadas pelo jogo.
+import os
+import pygame
+from assets import cached_backgrounds
+from config import SURFACE_MEMORY_BUDGET
+
+
+def _root(surface):
+    # superfície que realmente guarda os pixels (a página do atlas, para subsuperfícies)
+    while surface.get_parent() is not None:
+        surface = surface.get_parent()
+    return surface
+
+
+def _walk(value, depth=2):
+    """
+    Encontra as superfícies dentro de um valor (superfície, lista, tupla ou dict).
+
+    Recebe:
+        value: valor a percorrer.
+        depth (int): quantos níveis de listas/dicts ainda podem ser abertos.
+
+    Retorna:
+        list: superfícies encontradas.
+    """
+    if isinstance(value, pygame.Surface):
+        return [value]
+    if depth <= 0:
+        return []
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        found = []
+        for item in value:
+            found.extend(_walk(item, depth - 1))
+        return found
+    return []
+
+
+def sprite_sources(sprite, owner=None):
+    """
+    Lista os atributos de um sprite que guardam superfícies (imagem atual, caches
+    espelhados, projéteis...).
+
+    Recebe:
+        sprite: objeto do jogo (Dante, bosses).
+        owner (str ou None): nome do dono no relatório (padrão: nome da classe).
+
+    Retorna:
+        list: trios (dono, nome do atributo, valor).
+    """
+    owner = owner or type(sprite).__name__
+    return [(owner, name, value) for name, value in vars(sprite).items()
+            if name != 'assets' and _walk(value)]
+
+
+def surface_sources(assets=None, sprites=(), backgrounds=True):
+    """
+    Lista de onde vêm as superfícies carregadas: registro de assets (chaves comuns,
+    cache LRU e versões espelhadas), cache de cenários e atributos dos sprites.
+
+    Recebe:
+        assets (AssetRegistry, dict ou None): assets do jogo.
+        sprites (iterable): sprites a incluir (None é ignorado).
+        backgrounds (bool): incluir o cache de cenários.
+
+    Retorna:
+        list: trios (dono, nome, lista de superfícies), só os que têm superfícies.
+    """
+    sources = []
+    if assets is not None:
+        items = assets.surfaces() if hasattr(assets, 'surfaces') else assets.items()
+        sources += [('assets', name, value) for name, value in items]
+    if backgrounds:
+        sources += [('cenarios', os.path.basename(path), surf) for (path, _), surf in cached_backgrounds().items()]
+    for sprite in sprites:
+        if sprite is not None:
+            sources += sprite_sources(sprite)
+    walked = [(owner, name, _walk(value)) for owner, name, value in sources]
+    return [item for item in walked if item[2]]
+
+
+def collect_surfaces(assets=None, sprites=(), backgrounds=True):
+    """
+    Monta a lista de superfícies carregadas, com tamanho, bytes e dono.
+
+    O que faz:
+        - Percorre as origens de surface_sources().
+        - Cada buffer de pixels é contado uma vez só, no primeiro dono em que aparece;
+          frames de atlas contam a página inteira. Quem só reaproveita pixels já
+          contados (ex.: caches espelhados dos bosses que vêm do registro) aparece com
+          0 bytes e marcado como compartilhado.
+
+    Recebe:
+        assets (AssetRegistry, dict ou None): assets do jogo.
+        sprites (iterable): sprites a incluir (None é ignorado).
+        backgrounds (bool): incluir o cache de cenários.
+
+    Retorna:
+        list: um dict por linha com 'owner', 'name', 'count', 'size', 'bytes' e 'shared'.
+    """
+    counted = set()
+    rows = []
+    for owner, name, surfaces in surface_sources(assets, sprites, backgrounds):
+        total = 0
+        for surf in surfaces:
+            root = _root(surf)
+            if root in counted:
+                continue
+            counted.add(root)
+            total += root.get_pitch() * root.get_height()
+        sizes = {s.get_size() for s in surfaces}
+        size = '%dx%d' % surfaces[0].get_size() if len(sizes) == 1 else 'vários'
+        rows.append({
+            'owner': owner,
+            'name': str(name),
+            'count': len(surfaces),
+            'size': size,
+            'bytes': total,
+            'shared': total == 0,
+        })
+    rows.sort(key=lambda r: r['bytes'], reverse=True)
+    return rows
+
+
+def format_report(rows, budget=SURFACE_MEMORY_BUDGET):
+    """
+    Formata o relatório de memória (linhas já ordenadas por bytes).
+
+    Recebe:
+        rows (list): linhas de collect_surfaces().
+        budget (int): orçamento em bytes.
+
+    Retorna:
+        str: tabela com uma linha por conjunto de superfícies e o total no fim.
+    """
+    lines = ['%-12s %-30s %5s %11s %10s' % ('dono', 'nome', 'qtd', 'tamanho', 'KB')]
+    for r in rows:
+        kb = 'compart.' if r['shared'] else '%.1f' % (r['bytes'] / 1024)
+        lines.append('%-12s %-30s %5d %11s %10s' % (r['owner'], r['name'][:30], r['count'], r['size'], kb))
+    total = sum(r['bytes'] for r in rows)
+    lines.append('Total: %.1f MB de %.1f MB' % (total / 1024 / 1024, budget / 1024 / 1024))
+    return '\n'.join(lines)
+
+
+def check_budget(rows, budget=SURFACE_MEMORY_BUDGET):
+    """
+    Avisa (no terminal) se o total de memória das superfícies passou do orçamento.
+
+    Recebe:
+        rows (list): linhas de collect_surfaces().
+        budget (int): orçamento em bytes.
+
+    Retorna:
+        bool: True se o total está dentro do orçamento.
+    """
+    total = sum(r['bytes'] for r in rows)
+    if total <= budget:
+        return True
+    print("Aviso: superfícies usam %.1f MB, acima do orçamento de %.1f MB"
+          % (total / 1024 / 1024, budget / 1024 / 1024))
+    for r in rows[:5]:
+        print("   %s %s: %.1f KB" % (r['owner'], r['name'], r['bytes'] / 1024))
+    return False
+
+
+if __name__ == "__main__":
+    # Relatório com tudo carregado: assets, os três bosses e todos os cenários
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from config import LARGURA, ALTURA
+    pygame.init()
+    pygame.display.set_mode((LARGURA, ALTURA))
+    from assets import load_assets, load_background
+    from classes import Dante
+    from gula import BossGula
+    from ganancia import BossGanancia
+    from ira import BossIra
+
+    assets = load_assets()
+    for filename in ('Cenário_inferno.png', 'Cenário_gula.png', 'Cenário_ganancia.png', 'Cenário_ira.png'):
+        load_background(filename)
+    sprites = [Dante(assets=assets), BossGula(0, 0, assets), BossGanancia(0, 0, assets), BossIra(0, 0, assets)]
+    rows = collect_surfaces(assets, sprites)
+    print(format_report(rows))
+    check_budget(rows)
@@ -0,0 +1,182 @@
+# prefetch.py
+# Pré-carregamento da próxima sala em segundo plano.
+import threading
+import atlas
+from assets import decode_background, has_background, store_background
+from config import PREFETCH_CONVERTS_PER_FRAME, RENDER_SIZE
+
+
+class _Job:
+    """
+    Executa uma função numa thread daemon e guarda o resultado (ou o erro).
+    """
+
+    def __init__(self, fn, *args):
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+        threading.Thread(target=self._run, args=(fn, args), daemon=True).start()
+
+    def _run(self, fn, args):
+        try:
+            self.result = fn(*args)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done.set()
+
+
+class RoomPrefetcher:
+    """
+    Prepara os assets da próxima sala enquanto o jogador ainda está na sala atual.
+
+    A thread de trabalho lê/decodifica os frames do boss, cria as versões espelhadas e
+    decodifica o cenário. A conversão para o formato da tela fica na thread principal,
+    mas é feita aos poucos em poll() (algumas animações por frame; cada página de atlas
+    é convertida uma vez só), antes de o jogador chegar na porta. Na troca de sala sobra
+    só pegar o resultado pronto.
+    """
+
+    def __init__(self, assets, converts_per_frame=PREFETCH_CONVERTS_PER_FRAME, bg_size=RENDER_SIZE):
+        """
+        Recebe:
+            assets (AssetRegistry): registro de assets do jogo.
+            converts_per_frame (int): animações convertidas por chamada de poll().
+            bg_size (tuple): tamanho em que os cenários são preparados (resolução interna).
+
+        Retorna:
+            None
+        """
+        self.assets = assets
+        self.converts_per_frame = converts_per_frame
+        self.bg_size = tuple(bg_size)
+        self._jobs = {}      # sala -> _Job ainda na thread de trabalho
+        self._pending = {}   # sala -> (lista de conversões, resultado)
+        self._ready = {}     # sala -> cenário convertido (ou None)
+
+    def start(self, room, keys, bg_filename):
+        """
+        Começa a preparar uma sala em segundo plano (não faz nada se já começou ou se
+        os assets e o cenário da sala já estão carregados).
+
+        Recebe:
+            room (int): número da sala.
+            keys (iterable): chaves de assets do boss da sala.
+            bg_filename (str ou None): cenário da sala, dentro de IMG_DIR/inferno.
+
+        Retorna:
+            None
+        """
+        if room in self._jobs or room in self._pending or room in self._ready:
+            return
+        keys = [k for k in keys if not self.assets.is_loaded(k)]
+        if bg_filename and has_background(bg_filename, self.bg_size):
+            bg_filename = None
+        if not keys and not bg_filename:
+            return
+        self._jobs[room] = _Job(self._work, keys, bg_filename)
+
+    def _work(self, keys, bg_filename):
+        """
+        Parte feita na thread de trabalho: decodifica, espelha e redimensiona.
+
+        Recebe:
+            keys (list): chaves de assets ainda não carregadas.
+            bg_filename (str ou None): cenário da sala.
+
+        Retorna:
+            tuple: (frames por chave, frames espelhados por chave, cenário, nome do cenário)
+        """
+        frames = self.assets.decode(keys)
+        flipped_pages = {}
+        flipped = {k: atlas.flip_frames(frames[k], flipped_pages) for k in keys}
+        bg = decode_background(bg_filename, self.bg_size) if bg_filename else None
+        return frames, flipped, bg, bg_filename
+
+    def _collect(self, room):
+        """
+        Passa uma sala cuja thread terminou para a fila de conversões.
+
+        Recebe:
+            room (int): número da sala.
+
+        Retorna:
+            None
+        """
+        job = self._jobs.pop(room)
+        if job.error is not None:
+            print("Erro pré-carregando sala:", room, job.error)
+            self._ready[room] = None
+            return
+        frames, flipped, bg, bg_filename = job.result
+        todo = []
+        for key in frames:
+            alphas = self.assets.alpha_flags(key)
+            todo.append((frames, key, alphas))
+            todo.append((flipped, key, alphas))
+        result = {'frames': frames, 'flipped': flipped, 'bg': {'bg': []}, 'converted': {},
+                  'bg_filename': bg_filename}
+        if bg is not None:
+            result['bg']['bg'] = [bg]
+            todo.append((result['bg'], 'bg', [bool(bg.get_alpha())]))
+        self._pending[room] = (todo, result)
+
+    def _convert(self, room, limit=None):
+        """
+        Converte até `limit` animações de uma sala; ao terminar, entrega tudo ao registro.
+
+        Recebe:
+            room (int): número da sala.
+            limit (int ou None): máximo de conversões (None = todas).
+
+        Retorna:
+            int: quantas conversões foram feitas.
+        """
+        todo, result = self._pending[room]
+        done = 0
+        while todo and (limit is None or done < limit):
+            container, key, alphas = todo.pop()
+            container[key] = atlas.convert_frames(container[key], alphas, result['converted'])
+            done += 1
+        if not todo:
+            del self._pending[room]
+            for key, frames in result['frames'].items():
+                self.assets.store(key, frames, result['flipped'][key])
+            bg = result['bg']['bg'][0] if result['bg']['bg'] else None
+            if result['bg_filename']:
+                store_background(result['bg_filename'], bg, self.bg_size)
+            self._ready[room] = bg
+        return done
+
+    def poll(self):
+        """
+        Chamado uma vez por frame: recolhe trabalhos prontos e converte algumas superfícies.
+
+        Retorna:
+            None
+        """
+        for room in [r for r, job in self._jobs.items() if job.done.is_set()]:
+            self._collect(room)
+        budget = self.converts_per_frame
+        for room in list(self._pending):
+            if budget <= 0:
+                break
+            budget -= self._convert(room, budget)
+
+    def take(self, room):
+        """
+        Termina (se preciso, na hora) a preparação de uma sala e devolve o cenário.
+
+        Recebe:
+            room (int): número da sala.
+
+        Retorna:
+            pygame.Surface ou None: cenário convertido, ou None se a sala não foi
+                                    pré-carregada ou o cenário não existe.
+        """
+        if room in self._jobs:
+            self._jobs[room].done.wait()
+            self._collect(room)
+        if room in self._pending:
+            self._convert(room)
+        return self._ready.pop(room, None)
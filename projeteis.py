@@ -0,0 +1,318 @@
+# projeteis.py
+# Projéteis dos bosses (coxas, moedas e traços) guardados em arrays do NumPy, uma
+# coluna por atributo: movimento, expiração e colisão são feitos de uma vez só.
+import numpy as np
+import pygame
+
+# colunas de cada projétil e seus tipos
+_FIELDS = (
+    ('x', np.float64),       # canto superior esquerdo da hitbox (px, com fração)
+    ('y', np.float64),
+    ('px', np.float64),      # posição no passo anterior (para interpolar o desenho)
+    ('py', np.float64),
+    ('vx', np.float64),      # velocidade (px por segundo)
+    ('vy', np.float64),
+    ('w', np.int32),         # tamanho da hitbox (px)
+    ('h', np.int32),
+    ('life', np.float64),    # ms até sumir
+    ('arm', np.float64),     # ms até começar a causar dano (0 = já causa)
+    ('damage', np.int32),
+    ('image', np.int16),     # índice em ProjectilePool.images
+)
+
+# áreas de trabalho reaproveitadas a cada passo (não são copiadas ao crescer)
+_SCRATCH = (
+    ('_mask', np.bool_),
+    ('_mask2', np.bool_),
+    ('_tmp', np.float64),
+    ('_tmp2', np.float64),
+    ('_sx', np.float64),     # posição de desenho
+    ('_sy', np.float64),
+)
+
+_NO_HITS = np.empty(0, np.intp)
+
+
+class ProjectilePool:
+    """
+    Conjunto de projéteis de um boss em arrays pré-alocados (struct of arrays).
+
+    O que faz:
+        - Os projéteis vivos ficam sempre nas primeiras len(pool) posições de cada
+          array; remover é compactar com uma máscara, sem list.remove.
+        - step() move todos, desconta o tempo de vida/alerta e tira os expirados.
+        - overlapping()/hits() dizem quais projéteis encostam num retângulo.
+        - draw() monta a lista de blits com a posição interpolada entre passos.
+        - Quando enche, a capacidade dobra (os arrays são realocados uma vez).
+
+    Durante a luta nenhum objeto é criado por projétil: as contas usam áreas de
+    trabalho pré-alocadas (out=) e cada posição tem um registro de desenho fixo
+    [imagem, Rect], criado junto com a capacidade, que draw() só atualiza. As
+    imagens são compartilhadas (índice em images), nunca copiadas por projétil.
+    """
+    __slots__ = tuple(name for name, _ in _FIELDS + _SCRATCH) + (
+        'images', 'draw_offset', 'n', 'capacity', '_items')
+
+    def __init__(self, images=(), capacity=64, draw_offset=(0, 0)):
+        """
+        Recebe:
+            images (iterable): imagens dos projéteis (o campo image é o índice aqui).
+            capacity (int): quantos projéteis cabem antes de realocar.
+            draw_offset (tuple): deslocamento da imagem em relação à hitbox (ex.: traços
+                                 com hitbox menor que o desenho).
+
+        Retorna:
+            None
+        """
+        self.images = list(images)
+        self.draw_offset = draw_offset
+        self.n = 0
+        self.capacity = 0
+        self._items = []   # registro de desenho [imagem, Rect] de cada posição
+        self._grow(max(1, int(capacity)))
+
+    def _grow(self, capacity):
+        # realoca todas as colunas com a nova capacidade, mantendo os vivos
+        for name, dtype in _FIELDS:
+            column = np.zeros(capacity, dtype)
+            if self.capacity:
+                column[:self.n] = getattr(self, name)[:self.n]
+            setattr(self, name, column)
+        for name, dtype in _SCRATCH:
+            setattr(self, name, np.zeros(capacity, dtype))
+        self._items.extend([None, pygame.Rect(0, 0, 0, 0)] for _ in range(capacity - self.capacity))
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        """
+        Remove todos os projéteis.
+
+        Retorna:
+            None
+        """
+        self.n = 0
+
+    def spawn(self, x, y, w, h, vx=0.0, vy=0.0, life=np.inf, arm=0.0, damage=0, image=0):
+        """
+        Cria projéteis. Cada argumento pode ser um número ou um array (vários de uma vez).
+
+        Recebe:
+            x, y (float): canto superior esquerdo da hitbox.
+            w, h (int): tamanho da hitbox.
+            vx, vy (float): velocidade em px por segundo.
+            life (float): ms até sumir.
+            arm (float): ms até começar a causar dano.
+            damage (int): dano.
+            image (int): índice da imagem em self.images.
+
+        Retorna:
+            None
+        """
+        # só os arrays decidem quantos são (um array vazio não cria nenhum)
+        count = np.broadcast(x, y, w, h, vx, vy, life, arm, damage, image).size
+        if not count:
+            return
+        if self.n + count > self.capacity:
+            capacity = self.capacity
+            while self.n + count > capacity:
+                capacity *= 2
+            self._grow(capacity)
+        s = slice(self.n, self.n + count)
+        self.x[s] = x
+        self.y[s] = y
+        self.px[s] = x
+        self.py[s] = y
+        self.vx[s] = vx
+        self.vy[s] = vy
+        self.w[s] = w
+        self.h[s] = h
+        self.life[s] = life
+        self.arm[s] = arm
+        self.damage[s] = damage
+        self.image[s] = image
+        self.n += count
+
+    def _keep(self, keep):
+        # compacta os arrays deixando só os projéteis marcados em `keep`
+        n = int(np.count_nonzero(keep))
+        if n == self.n:
+            return
+        for name, _ in _FIELDS:
+            column = getattr(self, name)
+            column[:n] = column[:self.n][keep]
+        self.n = n
+
+    def remove(self, indices):
+        """
+        Remove os projéteis dos índices pedidos.
+
+        Recebe:
+            indices (array ou list): índices (entre 0 e len(pool) - 1).
+
+        Retorna:
+            None
+        """
+        if len(indices):
+            keep = np.ones(self.n, bool)
+            keep[indices] = False
+            self._keep(keep)
+
+    def step(self, dt, min_x=None, max_x=None):
+        """
+        Avança todos os projéteis dt ms e remove os que expiraram ou saíram da área.
+
+        Recebe:
+            dt (float): ms do passo.
+            min_x, max_x (float ou None): limites horizontais; quem sair deles some.
+
+        Retorna:
+            None
+        """
+        n = self.n
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        tmp = self._tmp[:n]
+        self.px[:n] = x
+        self.py[:n] = y
+        x += np.multiply(self.vx[:n], dt / 1000.0, out=tmp)
+        y += np.multiply(self.vy[:n], dt / 1000.0, out=tmp)
+        self.life[:n] -= dt
+        self.arm[:n] -= dt
+        keep = np.greater(self.life[:n], 0, out=self._mask[:n])
+        other = self._mask2[:n]
+        if min_x is not None:
+            keep &= np.greater_equal(np.add(x, self.w[:n], out=tmp), min_x, out=other)
+        if max_x is not None:
+            keep &= np.less_equal(x, max_x, out=other)
+        self._keep(keep)
+
+    def overlapping(self, left, top, right, bottom, armed=True, indices=None):
+        """
+        Índices dos projéteis cuja hitbox encosta no retângulo pedido. Os limites podem
+        ser arrays (um retângulo por projétil testado).
+
+        Recebe:
+            left, top, right, bottom (float ou array): limites do retângulo.
+            armed (bool): considerar só os que já causam dano.
+            indices (array ou None): testar só estes projéteis (ex.: candidatos da
+                                     broadphase); None = todos.
+
+        Retorna:
+            numpy.ndarray: índices.
+        """
+        if indices is not None:
+            if not len(indices):
+                return _NO_HITS
+            x, y = self.x[indices], self.y[indices]
+            mask = (x < right) & (x + self.w[indices] > left) & (y < bottom) & (y + self.h[indices] > top)
+            if armed:
+                mask &= self.arm[indices] <= 0
+            return indices[mask]
+        n = self.n
+        x, y = self.x[:n], self.y[:n]
+        tmp, other = self._tmp[:n], self._mask2[:n]
+        mask = np.less(x, right, out=self._mask[:n])
+        mask &= np.greater(np.add(x, self.w[:n], out=tmp), left, out=other)
+        mask &= np.less(y, bottom, out=other)
+        mask &= np.greater(np.add(y, self.h[:n], out=tmp), top, out=other)
+        if armed:
+            mask &= np.less_equal(self.arm[:n], 0, out=other)
+        if not mask.any():
+            return _NO_HITS
+        return np.flatnonzero(mask)
+
+    def hits(self, rect, armed=True, indices=None):
+        """
+        Índices dos projéteis que encostam num pygame.Rect.
+
+        Recebe:
+            rect (pygame.Rect): retângulo (ex.: o de Dante).
+            armed (bool): considerar só os que já causam dano.
+            indices (array ou None): testar só estes projéteis; None = todos.
+
+        Retorna:
+            numpy.ndarray: índices.
+        """
+        if not self.n:
+            return _NO_HITS
+        return self.overlapping(rect.left, rect.top, rect.right, rect.bottom, armed, indices)
+
+    def positions(self, alpha=1.0):
+        """
+        Onde desenhar cada projétil, interpolando entre o passo anterior e o atual.
+
+        Recebe:
+            alpha (float): fração do próximo passo já decorrida (Interpolator.alpha).
+
+        Retorna:
+            tuple: (xs, ys) arrays com o canto da imagem (válidos até a próxima chamada).
+        """
+        n = self.n
+        ox, oy = self.draw_offset
+        xs = np.add(self.x[:n], ox, out=self._sx[:n])
+        ys = np.add(self.y[:n], oy, out=self._sy[:n])
+        if alpha < 1.0:
+            # projéteis não teleportam, então sempre dá para voltar parte do passo
+            back = 1.0 - alpha
+            xs -= np.multiply(np.subtract(self.x[:n], self.px[:n], out=self._tmp[:n]), back, out=self._tmp[:n])
+            ys -= np.multiply(np.subtract(self.y[:n], self.py[:n], out=self._tmp2[:n]), back, out=self._tmp2[:n])
+        return xs, ys
+
+    def draw(self, surface, alpha=1.0, select=None, image=None):
+        """
+        Desenha os projéteis com um único blits().
+
+        Recebe:
+            surface: pygame.Surface, DirtyRenderer ou camada da RenderQueue.
+            alpha (float): fração do passo para interpolar (1.0 = posição atual).
+            select (array ou None): máscara booleana de quem desenhar (None = todos).
+            image (pygame.Surface ou None): imagem para todos (None = self.images[image]).
+
+        Retorna:
+            None
+        """
+        if not self.n:
+            return
+        xs, ys = self.positions(alpha)
+        xs, ys = xs.tolist(), ys.tolist()
+        indices = range(self.n) if select is None else np.flatnonzero(select).tolist()
+        images = self.images
+        kinds = self.image[:self.n].tolist() if image is None else None
+        items = self._items
+        batch = []
+        for i in indices:
+            # o registro da posição i é reaproveitado (só muda imagem e canto)
+            item = items[i]
+            item[0] = image if image is not None else images[kinds[i]]
+            rect = item[1]
+            rect.x = xs[i]
+            rect.y = ys[i]
+            batch.append(item)
+        if batch:
+            surface.blits(batch, doreturn=0)
+
+
+if __name__ == "__main__":
+    # mede um "bullet hell": milhares de moedas andando, testadas contra um retângulo e desenhadas
+    import time
+
+    pool = ProjectilePool([pygame.Surface((16, 16))], capacity=16)
+    screen = pygame.Surface((1280, 720))
+    rng = np.random.default_rng(0)
+    dante = pygame.Rect(600, 500, 80, 120)
+    for count in (100, 1000, 5000):
+        pool.clear()
+        pool.spawn(rng.uniform(0, 1280, count), rng.uniform(0, 720, count), 16, 16,
+                   rng.uniform(-300, 300, count), rng.uniform(-300, 300, count), life=1e9)
+        start = time.perf_counter()
+        frames = 600
+        for _ in range(frames):
+            pool.step(1000.0 / 60)
+            pool.hits(dante)
+            pool.draw(screen, 0.5)
+        ms = (time.perf_counter() - start) * 1000 / frames
+        print('%5d projéteis: %.3f ms por passo (mover + colidir + desenhar)' % (count, ms))
@@ -0,0 +1,340 @@
+# render.py
+# Desenho da tela de jogo com atualização só das áreas que mudaram (dirty rects).
+import math
+import weakref
+import pygame
+from config import RENDER_MODE, RENDER_SIZE
+from surfaces import prepare_surface
+
+
+def _merge(rects):
+    """
+    Junta as áreas que se sobrepõem (ex.: um sprite no frame anterior e no atual), para
+    cada pedaço da cena ser ampliado uma vez só.
+
+    Recebe:
+        rects (list): áreas (pygame.Rect).
+
+    Retorna:
+        list: áreas sem sobreposição entre si.
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRenderer:
+    """
+    Desenha a tela de jogo guardando os retângulos tocados em cada frame.
+
+    Modo 'dirty':
+        - begin() repõe o fundo só onde algo foi desenhado no frame anterior (o resto
+          da tela já é fundo puro), em vez de copiar a tela inteira.
+        - Tudo o que é desenhado passa por blit()/blits()/mark(), que anotam a área.
+        - present() envia para a tela só as áreas do frame anterior e do atual com
+          pygame.display.update(rects).
+    Modo 'full': desenha o fundo inteiro e chama pygame.display.flip() como antes.
+
+    Resolução interna (config.RENDER_SIZE): se for diferente da janela, a cena é
+    desenhada numa superfície fora da tela desse tamanho. As posições continuam em
+    coordenadas do mundo (LARGURA x ALTURA) e são convertidas aqui; cada imagem é
+    redimensionada uma vez (cache) e present() amplia o resultado para a janela.
+
+    Tem blit() e blits() com a mesma assinatura de pygame.Surface, então pode ser
+    passado no lugar da janela para Group.draw() e para os draw_traces() dos bosses.
+    """
+
+    def __init__(self, window, mode=RENDER_MODE, render_size=RENDER_SIZE):
+        """
+        Recebe:
+            window (pygame.Surface): superfície da janela.
+            mode (str): 'dirty' ou 'full'.
+            render_size (tuple): resolução interna da cena.
+
+        Retorna:
+            None
+        """
+        self.window = window
+        self.mode = mode
+        self.size = tuple(render_size)
+        self.scaled = self.size != window.get_size()
+        if self.scaled:
+            self.surface = pygame.Surface(self.size).convert()
+            ww, wh = window.get_size()
+            self._sx = self.size[0] / ww
+            self._sy = self.size[1] / wh
+            # blocos que escalam sem arredondamento (ex.: 3 px internos = 4 px na janela
+            # em 960 -> 1280); áreas alinhadas a eles ampliam igual à tela inteira
+            gx = self.size[0] // math.gcd(self.size[0], ww)
+            gy = self.size[1] // math.gcd(self.size[1], wh)
+            self._grid = (gx, gy)
+            self._images = weakref.WeakKeyDictionary()   # imagem -> imagem na resolução interna
+        else:
+            self.surface = window
+        self._background = None
+        self._fill = (0, 0, 0)
+        self._full_redraw = True
+        self._last = []      # áreas desenhadas no frame anterior
+        self._current = []   # áreas desenhadas neste frame
+
+    def invalidate(self):
+        """
+        Força o próximo frame a redesenhar e enviar a tela inteira.
+
+        Retorna:
+            None
+        """
+        self._full_redraw = True
+
+    def image(self, source):
+        """
+        Retorna uma imagem na resolução interna (redimensionada uma vez só).
+
+        Recebe:
+            source (pygame.Surface): imagem no tamanho do mundo.
+
+        Retorna:
+            pygame.Surface
+        """
+        if not self.scaled:
+            return source
+        scaled = self._images.get(source)
+        if scaled is None:
+            w, h = source.get_size()
+            size = (max(1, round(w * self._sx)), max(1, round(h * self._sy)))
+            scaled = prepare_surface(pygame.transform.scale(source, size))
+            self._images[source] = scaled
+        return scaled
+
+    def _pos(self, dest):
+        # converte uma posição (ou Rect) do mundo para a resolução interna
+        x, y = dest[0], dest[1]
+        return (round(x * self._sx), round(y * self._sy))
+
+    def begin(self, background, fill=(30, 30, 30)):
+        """
+        Começa um frame: coloca o fundo onde for preciso.
+
+        Recebe:
+            background (pygame.Surface ou None): fundo (do tamanho da janela ou já na
+                                                resolução interna).
+            fill (tuple): cor usada quando não há fundo.
+
+        Retorna:
+            None
+        """
+        if background is not None and background.get_size() != self.size:
+            background = self.image(background)
+        if background is not self._background or fill != self._fill:
+            self._background = background
+            self._fill = fill
+            self._full_redraw = True
+        if self.mode != 'dirty' or self._full_redraw:
+            self._restore(self.surface.get_rect())
+        else:
+            for rect in self._last:
+                self._restore(rect)
+
+    def _restore(self, rect):
+        # repõe o fundo (ou a cor de fundo) numa área da cena
+        if self._background is not None:
+            self.surface.blit(self._background, rect, rect)
+        else:
+            self.surface.fill(self._fill, rect)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """
+        Desenha uma superfície na cena e anota a área tocada.
+
+        Recebe / Retorna: igual a pygame.Surface.blit (posição em coordenadas do mundo).
+        """
+        if self.scaled:
+            source = self.image(source)
+            dest = self._pos(dest)
+            area = self._area(area)
+        rect = self.surface.blit(source, dest, area, special_flags)
+        self._current.append(rect)
+        return rect
+
+    def _area(self, area):
+        # recorte da origem (coordenadas do mundo) na resolução interna; None fica None
+        if area is None:
+            return None
+        return pygame.Rect(self._pos(area), (round(area[2] * self._sx), round(area[3] * self._sy)))
+
+    def blits(self, blit_sequence, doreturn=1):
+        """
+        Desenha várias superfícies de uma vez e anota as áreas tocadas.
+
+        Recebe / Retorna: igual a pygame.Surface.blits (posições em coordenadas do mundo).
+        """
+        if self.scaled:
+            blit_sequence = [(self.image(item[0]), self._pos(item[1]))
+                             + ((self._area(item[2]),) + tuple(item[3:]) if len(item) > 2 else ())
+                             for item in blit_sequence]
+        rects = self.surface.blits(blit_sequence, doreturn=1)
+        self._current.extend(rects)
+        return rects if doreturn else None
+
+    def mark(self, rect):
+        """
+        Anota uma área desenhada diretamente na cena (ex.: pygame.draw.rect).
+
+        Recebe:
+            rect (pygame.Rect): área tocada, em coordenadas da cena.
+
+        Retorna:
+            pygame.Rect: a própria área.
+        """
+        self._current.append(rect)
+        return rect
+
+    def _upscale(self, rect):
+        """
+        Amplia uma área da cena para a janela e devolve a área correspondente na janela.
+
+        A área é alinhada aos blocos de escala exata, então ampliar só ela dá o mesmo
+        resultado que ampliar a tela inteira.
+        """
+        gx, gy = self._grid
+        left = rect.left // gx * gx
+        top = rect.top // gy * gy
+        right = min(self.size[0], -(-rect.right // gx) * gx)
+        bottom = min(self.size[1], -(-rect.bottom // gy) * gy)
+        if right <= left or bottom <= top:
+            return None
+        src = pygame.Rect(left, top, right - left, bottom - top)
+        dst = pygame.Rect(round(left / self._sx), round(top / self._sy),
+                          round(right / self._sx) - round(left / self._sx),
+                          round(bottom / self._sy) - round(top / self._sy))
+        pygame.transform.scale(self.surface.subsurface(src), dst.size, self.window.subsurface(dst))
+        return dst
+
+    def present(self):
+        """
+        Termina o frame e envia para a tela o que mudou.
+
+        Retorna:
+            None
+        """
+        full = self.mode != 'dirty' or self._full_redraw
+        if self.scaled:
+            if full:
+                pygame.transform.scale(self.surface, self.window.get_size(), self.window)
+            else:
+                rects = [self._upscale(r) for r in _merge(self._last + self._current)]
+                pygame.display.update([r for r in rects if r is not None])
+        elif not full:
+            pygame.display.update(self._last + self._current)
+        if full:
+            pygame.display.flip()
+        self._last = self._current
+        self._current = []
+        self._full_redraw = False
+
+
+# Camadas da tela de jogo, desenhadas da menor para a maior
+LAYER_TRACES = 10    # traços e projéteis dos bosses
+LAYER_PLAYER = 20    # Dante
+LAYER_ENEMIES = 30   # bosses
+LAYER_HUD = 40       # corações e barra de vida
+
+
+class _LayerTarget:
+    """
+    Alvo de desenho de uma camada: tem blit()/blits() como pygame.Surface, mas só
+    coloca os pedidos na fila (para draw_traces() dos bosses e para o HUD).
+    """
+
+    def __init__(self, items):
+        self.items = items
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if area is None and not special_flags:
+            self.items.append((source, dest))
+        else:
+            self.items.append((source, dest, area, special_flags))
+
+    def blits(self, blit_sequence, doreturn=1):
+        self.items.extend(blit_sequence)
+        return None
+
+
+class RenderQueue:
+    """
+    Fila de desenho por camadas.
+
+    Cada entidade envia seus blits para uma camada; flush() percorre as camadas em
+    ordem uma vez só e desenha cada camada com uma única chamada a blits(). Dentro da
+    camada a ordem é a ordem de envio.
+    """
+
+    def __init__(self):
+        self._layers = {}
+
+    def layer(self, layer):
+        """
+        Retorna um alvo com blit()/blits() que envia para a camada pedida.
+
+        Recebe:
+            layer (int): camada (LAYER_*).
+
+        Retorna:
+            _LayerTarget
+        """
+        return _LayerTarget(self._layers.setdefault(layer, []))
+
+    def submit(self, layer, source, dest):
+        """
+        Envia um blit para uma camada.
+
+        Recebe:
+            layer (int): camada (LAYER_*).
+            source (pygame.Surface): superfície.
+            dest: posição ou pygame.Rect.
+
+        Retorna:
+            None
+        """
+        self._layers.setdefault(layer, []).append((source, dest))
+
+    def submit_sprites(self, layer, sprites, position=None):
+        """
+        Envia a imagem de cada sprite (na posição do seu rect) para uma camada.
+
+        Recebe:
+            layer (int): camada (LAYER_*).
+            sprites (iterable): sprites com image e rect.
+            position (callable ou None): position(sprite, rect) -> onde desenhar (ex.:
+                Interpolator.position); None = o próprio rect.
+
+        Retorna:
+            None
+        """
+        items = self._layers.setdefault(layer, [])
+        if position is None:
+            items.extend((s.image, s.rect) for s in sprites)
+        else:
+            items.extend((s.image, position(s, s.rect)) for s in sprites)
+
+    def flush(self, target):
+        """
+        Desenha todas as camadas em ordem e esvazia a fila.
+
+        Recebe:
+            target: pygame.Surface ou DirtyRenderer.
+
+        Retorna:
+            None
+        """
+        layers = self._layers
+        self._layers = {}
+        for layer in sorted(layers):
+            if layers[layer]:
+                target.blits(layers[layer], doreturn=0)
@@ -0,0 +1,517 @@
+# simulacao.py
+# Núcleo da simulação da tela de jogo (Dante, bosses, salas e colisões), sem janela,
+# sem som e sem relógio de verdade: o tempo e os comandos do jogador são injetados.
+import os
+import random
+import time
+import numpy as np
+import pygame
+from config import LARGURA, ALTURA, SIM_STEP
+from classes import Dante
+from broadphase import SpatialHash
+from gula import BossGula
+from ganancia import BossGanancia
+from ira import BossIra
+
+ROOM_COUNT = 6
+PLATFORM_Y = ALTURA - 110
+
+# eventos gerados por Simulation.step() (a tela de jogo toca os sons a partir deles)
+EVENT_ATTACK = 'attack'   # Dante atacou
+EVENT_HURT = 'hurt'       # Dante levou dano de traço/coxa ou começou a morrer
+EVENT_ROOM = 'room'       # Dante trocou de sala
+
+
+class SimClock:
+    """
+    Relógio da simulação em ms: só anda quando a simulação dá um passo.
+
+    Chamar o relógio (clock()) devolve o tempo atual, igual a pygame.time.get_ticks,
+    então ele pode ser passado no lugar de get_ticks (ex.: BossIra(clock=...)).
+    """
+
+    def __init__(self, start=0.0):
+        """
+        Recebe:
+            start (float): tempo inicial em ms.
+
+        Retorna:
+            None
+        """
+        self.time = float(start)
+
+    def __call__(self):
+        return self.time
+
+    def advance(self, dt):
+        """
+        Avança o relógio.
+
+        Recebe:
+            dt (float): ms a avançar.
+
+        Retorna:
+            None
+        """
+        self.time += dt
+
+
+class PlayerInput:
+    """
+    Comandos do jogador para um passo da simulação.
+
+    left/right são teclas seguradas; jump/attack valem só no passo em que chegam
+    (equivalem a um KEYDOWN).
+    """
+    __slots__ = ('left', 'right', 'jump', 'attack')
+
+    def __init__(self, left=False, right=False, jump=False, attack=False):
+        self.left = left
+        self.right = right
+        self.jump = jump
+        self.attack = attack
+
+
+NO_INPUT = PlayerInput()
+
+
+class Simulation:
+    """
+    Estado e regras da tela de jogo, sem nada de tela, som ou eventos do pygame.
+
+    O que faz:
+        - Guarda Dante, os bosses (criados quando a sala deles é acessada), a sala atual
+          e os grupos de sprites.
+        - step() aplica os comandos do jogador e avança tudo um passo fixo: troca de
+          sala, Dante, bosses, projéteis, traços, dano e mortes.
+        - As colisões (ataque de Dante e projéteis em Dante) consultam uma grade
+          uniforme (broadphase.SpatialHash) com todos os sprites e projéteis.
+        - O relógio é injetado (SimClock por padrão), então a simulação roda tão rápido
+          quanto o processador deixar, sem janela (ver run_headless).
+
+    A tela de jogo (jogo.game_screen) usa a mesma classe: lê o teclado, chama step()
+    e desenha o estado.
+    """
+
+    def __init__(self, assets, clock=None, step=SIM_STEP, room=1, boss_kwargs=None):
+        """
+        Recebe:
+            assets (AssetRegistry ou dict): imagens (podem vir de load_headless_assets).
+            clock (SimClock ou None): relógio da simulação.
+            step (float): duração de cada passo em ms.
+            room (int): sala inicial (começar numa sala de boss já coloca o boss no jogo).
+            boss_kwargs (dict ou None): argumentos extras do construtor de cada boss,
+                por nome ('gula', 'ganancia', 'ira'), ex.: {'ira': {'hp': 400}}.
+
+        Retorna:
+            None
+        """
+        self.assets = assets
+        self.boss_kwargs = boss_kwargs or {}
+        self.clock = clock if clock is not None else SimClock()
+        self.step_ms = float(step)
+        self.steps = 0
+        self.events = []
+
+        self.all_sprites = pygame.sprite.Group()
+        self.enemies = pygame.sprite.Group()
+        self.dante = Dante(groups=[self.all_sprites], assets=assets)
+        self.dante.rect.midbottom = (LARGURA // 2, PLATFORM_Y)
+
+        # Nós guardamos referências aos bosses, mas só os adicionamos ao Group quando
+        # estiverem na sala correta.
+        self.gula = None
+        self.luxuria = None
+        self.ira = None
+        self.victory = False
+
+        # grade de colisão (broadphase): refeita a cada passo e ao trocar de sala
+        self.grid = SpatialHash()
+
+        self._enter_room(room)
+        self.events = []
+
+    def spawn_bosses_for_room(self, room):
+        """
+        Cria instâncias dos bosses necessários para a sala atual (lazy instantiation).
+
+        Recebe:
+            room (int): Número da sala atual.
+
+        Retorna:
+            None
+        """
+        if room == 2 and self.gula is None:
+            kwargs = dict(patrol_min_x=120, patrol_max_x=LARGURA - 120, speed=2.0)
+            kwargs.update(self.boss_kwargs.get('gula', {}))
+            self.gula = BossGula(LARGURA // 2 + 100, PLATFORM_Y, assets=self.assets, **kwargs)
+        if room == 4 and self.luxuria is None:
+            self.luxuria = BossGanancia(LARGURA // 2, PLATFORM_Y, assets=self.assets,
+                                        **self.boss_kwargs.get('ganancia', {}))
+        if room == 6 and self.ira is None:
+            self.ira = BossIra(LARGURA // 2 + 100, PLATFORM_Y, assets=self.assets, clock=self.clock,
+                               **self.boss_kwargs.get('ira', {}))
+
+    def bosses_by_room(self):
+        # boss de cada sala (None se ainda não foi criado ou já morreu)
+        return {2: self.gula, 4: self.luxuria, 6: self.ira}
+
+    def boss_alive(self):
+        """
+        Diz se o boss da sala atual está vivo (a sala fica trancada).
+
+        Retorna:
+            bool
+        """
+        boss = self.bosses_by_room().get(self.current_room)
+        return boss is not None and getattr(boss, 'alive_flag', False)
+
+    def hud_boss(self):
+        """
+        Retorna o boss mostrado no HUD e o nome dele.
+
+        Retorna:
+            tuple: (boss ou None, nome ou None)
+        """
+        if self.ira is not None:
+            return self.ira, "IRA"
+        if self.gula is not None:
+            return self.gula, "GULA"
+        if self.luxuria is not None:
+            return self.luxuria, "LUXÚRIA"
+        return None, None
+
+    @property
+    def game_over(self):
+        # Dante sem vidas e com a animação de morte terminada
+        return self.dante.lives <= 0 and getattr(self.dante, 'die_played', False)
+
+    def moving_objects(self):
+        """
+        Sprites que se movem entre passos, para interpolação (os projéteis guardam a
+        posição anterior nos próprios arrays, ver projeteis.ProjectilePool).
+
+        Retorna:
+            list: pares (objeto, pygame.Rect).
+        """
+        items = [(s, s.rect) for s in self.all_sprites]
+        items.extend((e, e.rect) for e in self.enemies)
+        return items
+
+    def pop_events(self):
+        """
+        Retorna e esvazia os eventos gerados desde a última chamada.
+
+        Retorna:
+            list: eventos (EVENT_*).
+        """
+        events = self.events
+        self.events = []
+        return events
+
+    def _apply_input(self, inp):
+        # comandos do jogador (antes eram lidos direto dos eventos do pygame)
+        dante = self.dante
+        if getattr(dante, 'is_dying', False):
+            dante.parar()
+            return
+        if inp.jump:
+            dante.pular()
+        if inp.attack:
+            self.events.append(EVENT_ATTACK)
+            dante.attack(self.enemies, self.grid)
+            for e in self.enemies:
+                if hasattr(e, 'notify_player_attack'):
+                    try:
+                        e.notify_player_attack()
+                    except Exception:
+                        pass
+        if inp.left and inp.right:
+            dante.parar()
+        elif inp.left:
+            dante.mover_esquerda()
+        elif inp.right:
+            dante.mover_direita()
+        else:
+            dante.parar()
+
+    def _enter_room(self, room):
+        # coloca no grupo só o boss da sala nova
+        self.current_room = room
+        self.spawn_bosses_for_room(room)
+        for sala, boss in self.bosses_by_room().items():
+            if boss is None:
+                continue
+            if sala == room and boss not in self.enemies:
+                self.enemies.add(boss)
+            elif sala != room and boss in self.enemies:
+                self.enemies.remove(boss)
+        self._rebuild_grid()
+        self.events.append(EVENT_ROOM)
+
+    def _move_between_rooms(self):
+        # portas das laterais: trancadas enquanto o boss da sala estiver vivo
+        dante = self.dante
+        boss_vivo = self.boss_alive()
+        if dante.rect.right >= LARGURA:
+            if boss_vivo or self.current_room >= ROOM_COUNT:
+                dante.rect.right = LARGURA - 2
+                if dante.speedx > 0:
+                    dante.parar()
+            else:
+                dante.rect.left = 10
+                dante.rect.midbottom = (dante.rect.centerx, PLATFORM_Y)
+                dante.parar()
+                self._enter_room(self.current_room + 1)
+
+        if dante.rect.left <= 0:
+            if boss_vivo or self.current_room <= 1:
+                dante.rect.left = 2
+                if dante.speedx < 0:
+                    dante.parar()
+            else:
+                dante.rect.right = LARGURA - 10
+                dante.rect.midbottom = (dante.rect.centerx, PLATFORM_Y)
+                dante.parar()
+                self._enter_room(self.current_room - 1)
+
+    def _update_enemies(self, dt):
+        # atualiza os bosses (movimento, ataques e projéteis)
+        dante = self.dante
+        for e in list(self.enemies):
+            try:
+                e.update(dt, window_width=LARGURA, ground_y=PLATFORM_Y, player=dante)
+            except TypeError:
+                try:
+                    e.update(dt, window_width=LARGURA, ground_y=PLATFORM_Y)
+                except Exception:
+                    try:
+                        e.update(dt)
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+
+    def _rebuild_grid(self):
+        # registra sprites e projéteis nas posições atuais na grade de colisão
+        grid = self.grid
+        grid.clear()
+        grid.insert_sprites(self.all_sprites)
+        grid.insert_sprites(self.enemies)
+        for e in self.enemies:
+            for pool in (getattr(e, 'traces', None), getattr(e, 'coxas', None),
+                         getattr(e, 'projectiles', None)):
+                if pool:
+                    grid.insert_pool(pool)
+
+    def _collide(self):
+        # aplica o dano dos traços, das coxas e das moedas em Dante (consultas à grade)
+        dante = self.dante
+        grid = self.grid
+        for e in self.enemies:
+            traces = getattr(e, 'traces', None)
+            # versão alinhada: deixa a área dos pés maior e "encaixa" verticalmente com o hitbox do trace
+            # só aplica a verificação se o jogador estiver no chão (evita dano no ar)
+            if traces and getattr(dante, 'no_chao', False):
+                feet_h = 28
+                feet_w = max(32, int(dante.rect.width * 0.45))
+                feet_x = dante.rect.centerx - feet_w // 2
+
+                # candidatos: traços na coluna dos pés, do alto da tela até a plataforma
+                near = grid.query_pool(traces, pygame.Rect(feet_x, 0, feet_w, PLATFORM_Y), exact=False)
+
+                # alinha verticalmente: coloca os pés um pouco acima de PLATFORM_Y e
+                # também permite que a área encaixe com o topo de cada trace
+                feet_y = np.minimum(PLATFORM_Y - feet_h, traces.y[near] + 4)
+
+                # só os traços já fora do alerta (armados) causam dano
+                hits = traces.overlapping(feet_x, feet_y, feet_x + feet_w, feet_y + feet_h, indices=near)
+                for i in hits:
+                    dante.dano(amount=int(traces.damage[i]))
+                    self.events.append(EVENT_HURT)
+                traces.remove(hits)
+
+            coxas = getattr(e, 'coxas', None)
+            if coxas:
+                hits = grid.query_pool(coxas, dante.rect)
+                for i in hits:
+                    dante.dano(amount=int(coxas.damage[i]))
+                    self.events.append(EVENT_HURT)
+                coxas.remove(hits)
+
+            coins = getattr(e, 'projectiles', None)
+            if coins:
+                hits = grid.query_pool(coins, dante.rect)
+                # as moedas tiram vida sem tocar o som de dano (como antes da grade)
+                for i in hits:
+                    dante.dano(amount=int(coins.damage[i]))
+                coins.remove(hits)
+
+    def _remove_dead(self):
+        # tira do jogo os bosses que terminaram de morrer; a Ira morta encerra o jogo
+        if self.ira is not None and not self.ira.alive_flag:
+            self.ira.kill()
+            self.ira = None
+            self.victory = True
+            return
+        if self.gula is not None and not self.gula.alive_flag:
+            self.gula.kill()
+            self.gula = None
+        if self.luxuria is not None and not self.luxuria.alive_flag:
+            self.luxuria.kill()
+            self.luxuria = None
+        dante = self.dante
+        if dante.lives <= 0:
+            if not getattr(dante, 'is_dying', False) and not getattr(dante, 'die_played', False):
+                dante.morrer()
+                self.events.append(EVENT_HURT)
+
+    def step(self, inp=NO_INPUT):
+        """
+        Avança a simulação um passo fixo.
+
+        Recebe:
+            inp (PlayerInput): comandos do jogador neste passo.
+
+        Retorna:
+            None
+        """
+        if self.victory:
+            return
+        self._apply_input(inp)
+        self._move_between_rooms()
+        self.all_sprites.update(self.step_ms)
+        self._update_enemies(self.step_ms)
+        self._rebuild_grid()
+        self._collide()
+        self._remove_dead()
+        self.clock.advance(self.step_ms)
+        self.steps += 1
+
+
+def run_headless(policy, assets=None, room=1, max_ms=5 * 60 * 1000, seed=None, step=SIM_STEP,
+                 boss_kwargs=None):
+    """
+    Roda uma partida inteira sem janela, o mais rápido possível.
+
+    Recebe:
+        policy (callable): policy(sim) -> PlayerInput, chamada a cada passo (o "jogador").
+        assets (dict ou None): imagens; None = load_headless_assets().
+        room (int): sala inicial.
+        max_ms (float): tempo máximo de jogo simulado (ms).
+        seed (int ou None): semente do random (para repetir a mesma partida).
+        step (float): duração de cada passo em ms.
+        boss_kwargs (dict ou None): parâmetros dos bosses (ver Simulation).
+
+    Retorna:
+        dict: 'result' ('victory', 'game_over' ou 'timeout'), 'room', 'sim_ms', 'steps',
+              'hp' (vida de Dante) e 'wall_s' (tempo real gasto).
+    """
+    if seed is not None:
+        random.seed(seed)
+    if assets is None:
+        from assets import load_headless_assets
+        assets = load_headless_assets()
+    sim = Simulation(assets, step=step, room=room, boss_kwargs=boss_kwargs)
+    start = time.perf_counter()
+    result = 'timeout'
+    while sim.clock() < max_ms:
+        sim.step(policy(sim))
+        if sim.victory:
+            result = 'victory'
+            break
+        if sim.game_over:
+            result = 'game_over'
+            break
+    return {
+        'result': result,
+        'room': sim.current_room,
+        'sim_ms': sim.clock(),
+        'steps': sim.steps,
+        'hp': sim.dante.hp,
+        'wall_s': time.perf_counter() - start,
+    }
+
+
+def walk_right_policy(sim):
+    """
+    Jogador simples para testes: anda para a direita e ataca o boss quando está perto.
+
+    Recebe:
+        sim (Simulation): simulação.
+
+    Retorna:
+        PlayerInput
+    """
+    dante = sim.dante
+    boss = sim.bosses_by_room().get(sim.current_room)
+    if boss is not None and getattr(boss, 'is_dying', False):
+        return NO_INPUT   # bater num boss morrendo recomeça a animação de morte da Gula
+    if boss is not None and getattr(boss, 'alive_flag', False):
+        dx = boss.rect.centerx - dante.rect.centerx
+        attack = abs(dx) <= dante.attack_range and sim.steps % 10 == 0
+        return PlayerInput(left=dx < -dante.attack_range // 2, right=dx > dante.attack_range // 2,
+                           attack=attack)
+    return PlayerInput(right=True)
+
+
+def dodge_policy(sim):
+    """
+    Jogador de teste que desvia: pula coxas e moedas que vêm na sua direção, sai de
+    cima dos traços da Ira e, fora isso, se aproxima do boss e ataca.
+
+    Recebe:
+        sim (Simulation): simulação.
+
+    Retorna:
+        PlayerInput
+    """
+    dante = sim.dante
+    boss = sim.bosses_by_room().get(sim.current_room)
+    if boss is None or not getattr(boss, 'alive_flag', False):
+        return PlayerInput(right=True)
+    if getattr(boss, 'is_dying', False):
+        return NO_INPUT
+
+    # traços da Ira (avisando ou ativos) embaixo de Dante: anda para a borda mais próxima
+    traces = getattr(boss, 'traces', None)
+    if traces:
+        cx = dante.rect.centerx
+        under = traces.overlapping(cx, -np.inf, cx + 1, np.inf, armed=False)
+        if len(under):
+            left = traces.x[under[0]]
+            right = left + traces.w[under[0]]
+            go_left = cx - left < right - cx
+            return PlayerInput(left=go_left, right=not go_left)
+
+    # projéteis vindo na direção de Dante e na altura dele: pula
+    jump = False
+    if getattr(dante, 'no_chao', False):
+        for pool in (getattr(boss, 'coxas', None), getattr(boss, 'projectiles', None)):
+            if not pool:
+                continue
+            n = len(pool)
+            dx = dante.rect.centerx - (pool.x[:n] + pool.w[:n] / 2)
+            incoming = ((dx * pool.vx[:n] > 0) & (np.abs(dx) < 160)
+                        & (pool.y[:n] + pool.h[:n] > dante.rect.top) & (pool.y[:n] < dante.rect.bottom))
+            if incoming.any():
+                jump = True
+                break
+
+    dx = boss.rect.centerx - dante.rect.centerx
+    attack = abs(dx) <= dante.attack_range and sim.steps % 10 == 0
+    return PlayerInput(left=dx < -dante.attack_range // 2, right=dx > dante.attack_range // 2,
+                       jump=jump, attack=attack)
+
+
+# jogadores de teste por nome (usado por balanceamento.py)
+POLICIES = {
+    'walk_right': walk_right_policy,
+    'dodge': dodge_policy,
+}
+
+
+if __name__ == "__main__":
+    # uma partida sem janela com o jogador de teste
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    print(run_headless(walk_right_policy, seed=0))
@@ -0,0 +1,188 @@
+# surfaces.py
+# Preparação das superfícies para o formato da tela (blits rápidos) e relatório dos
+# caminhos de blit lentos que ainda sobrarem.
+import os
+import pygame
+from config import SURFACE_RLE
+
+
+def _display():
+    # superfície da janela, ou None se o modo de vídeo ainda não foi criado
+    return pygame.display.get_surface() if pygame.display.get_init() else None
+
+
+def _transparent(surface):
+    # alpha por pixel ou colorkey: os dois casos que o RLE acelera
+    return bool(surface.get_flags() & pygame.SRCALPHA) or surface.get_colorkey() is not None
+
+
+def is_opaque(surface):
+    """
+    Diz se uma superfície com alpha por pixel na verdade não tem nenhum pixel transparente.
+
+    Recebe:
+        surface (pygame.Surface): superfície.
+
+    Retorna:
+        bool
+    """
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return True
+    w, h = surface.get_size()
+    return pygame.mask.from_surface(surface, 254).count() == w * h
+
+
+def is_display_format(surface):
+    """
+    Diz se a superfície já está no formato de pixel da tela (blit sem conversão).
+
+    Recebe:
+        surface (pygame.Surface): superfície.
+
+    Retorna:
+        bool (True também quando ainda não há janela para comparar)
+    """
+    display = _display()
+    if display is None:
+        return True
+    return (surface.get_bytesize() == display.get_bytesize()
+            and surface.get_masks()[:3] == display.get_masks()[:3])
+
+
+def prepare_surface(surface, rle=SURFACE_RLE):
+    """
+    Deixa uma superfície no formato mais rápido para desenhar na tela.
+
+    O que faz:
+        - Imagens com alpha por pixel que não têm nenhum pixel transparente viram
+          opacas (convert); as demais vão para o formato da tela (convert / convert_alpha).
+        - Imagens com alpha ou colorkey recebem RLEACCEL (as áreas transparentes são
+          puladas no blit).
+        - Subsuperfícies (frames de atlas) não são copiadas: a página já foi convertida
+          em atlas.convert_frames, então só recebem o RLE.
+
+    Recebe:
+        surface (pygame.Surface ou None): superfície.
+        rle (bool): aplicar RLEACCEL.
+
+    Retorna:
+        pygame.Surface ou None: a superfície preparada (pode ser a mesma).
+    """
+    if surface is None or _display() is None:
+        return surface
+    if surface.get_parent() is None:
+        if surface.get_flags() & pygame.SRCALPHA:
+            if is_opaque(surface):
+                surface = surface.convert()
+            elif not is_display_format(surface):
+                surface = surface.convert_alpha()
+        elif not is_display_format(surface):
+            surface = surface.convert()
+    if rle and not surface.get_flags() & pygame.RLEACCELOK:
+        if surface.get_flags() & pygame.SRCALPHA:
+            surface.set_alpha(surface.get_alpha(), pygame.RLEACCEL)
+        elif surface.get_colorkey() is not None:
+            surface.set_colorkey(surface.get_colorkey(), pygame.RLEACCEL)
+    return surface
+
+
+def prepare_frames(frames, rle=SURFACE_RLE):
+    """
+    Aplica prepare_surface a uma lista de frames (ou a uma imagem avulsa).
+
+    Recebe:
+        frames (list, pygame.Surface ou None): frames.
+        rle (bool): aplicar RLEACCEL.
+
+    Retorna:
+        list, pygame.Surface ou None: no mesmo formato recebido.
+    """
+    if isinstance(frames, list):
+        return [prepare_surface(f, rle) for f in frames]
+    return prepare_surface(frames, rle)
+
+
+def slow_blit_reasons(surface):
+    """
+    Lista os motivos que deixam o blit de uma superfície mais lento que o necessário.
+
+    Recebe:
+        surface (pygame.Surface): superfície.
+
+    Retorna:
+        list: motivos (vazia se a superfície está no caminho rápido).
+    """
+    reasons = []
+    if not is_display_format(surface):
+        reasons.append('fora do formato da tela')
+    if surface.get_parent() is None and surface.get_flags() & pygame.SRCALPHA and is_opaque(surface):
+        reasons.append('alpha por pixel sem transparência')
+    if _transparent(surface) and not surface.get_flags() & pygame.RLEACCELOK:
+        reasons.append('transparente sem RLE')
+    return reasons
+
+
+def collect_slow_surfaces(assets=None, sprites=(), backgrounds=True):
+    """
+    Procura superfícies carregadas que ainda caem em caminhos de blit lentos.
+
+    Recebe:
+        assets (AssetRegistry, dict ou None): assets do jogo.
+        sprites (iterable): sprites a incluir (None é ignorado).
+        backgrounds (bool): incluir o cache de cenários.
+
+    Retorna:
+        list: um dict por conjunto com 'owner', 'name', 'count' (superfícies lentas) e
+              'reasons' (motivos encontrados).
+    """
+    from memory import surface_sources
+    rows = []
+    for owner, name, surfaces in surface_sources(assets, sprites, backgrounds):
+        count = 0
+        reasons = []
+        for surf in surfaces:
+            found = slow_blit_reasons(surf)
+            if found:
+                count += 1
+                reasons += [r for r in found if r not in reasons]
+        if count:
+            rows.append({'owner': owner, 'name': str(name), 'count': count, 'reasons': reasons})
+    return rows
+
+
+def format_slow_report(rows):
+    """
+    Formata o relatório de caminhos de blit lentos.
+
+    Recebe:
+        rows (list): linhas de collect_slow_surfaces().
+
+    Retorna:
+        str
+    """
+    if not rows:
+        return 'Nenhuma superfície em caminho de blit lento.'
+    lines = ['%-12s %-30s %5s  %s' % ('dono', 'nome', 'qtd', 'motivos')]
+    for r in rows:
+        lines.append('%-12s %-30s %5d  %s' % (r['owner'], r['name'][:30], r['count'], ', '.join(r['reasons'])))
+    return '\n'.join(lines)
+
+
+if __name__ == "__main__":
+    # Relatório com tudo carregado: assets, os três bosses e todos os cenários
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from config import LARGURA, ALTURA
+    pygame.init()
+    pygame.display.set_mode((LARGURA, ALTURA))
+    from assets import load_assets, load_background
+    from classes import Dante
+    from gula import BossGula
+    from ganancia import BossGanancia
+    from ira import BossIra
+
+    assets = load_assets()
+    for filename in ('Cenário_inferno.png', 'Cenário_gula.png', 'Cenário_ganancia.png', 'Cenário_ira.png'):
+        load_background(filename)
+    sprites = [Dante(assets=assets), BossGula(0, 0, assets), BossGanancia(0, 0, assets), BossIra(0, 0, assets)]
+    print(format_slow_report(collect_slow_surfaces(assets, sprites)))
@@ -0,0 +1,118 @@
+# timestep.py
+# Simulação em passo fixo (acumulador) e interpolação das posições na hora de desenhar.
+from config import SIM_STEP, MAX_SIM_STEPS
+
+# deslocamento (px) a partir do qual a posição não é interpolada (ex.: troca de sala)
+SNAP_DISTANCE = 200
+
+
+class FixedStep:
+    """
+    Acumulador de tempo para rodar a simulação em passos de tamanho fixo.
+
+    O que faz:
+        - advance() soma o tempo real do frame e diz quantos passos de `step` ms a
+          simulação deve dar agora (no máximo `max_steps`; o excesso é descartado,
+          para um frame lento não gerar uma fila de passos cada vez maior).
+        - alpha diz quanto do próximo passo já passou (0 a 1), usado para interpolar
+          as posições na hora de desenhar.
+    """
+
+    def __init__(self, step=SIM_STEP, max_steps=MAX_SIM_STEPS):
+        """
+        Recebe:
+            step (float): duração de um passo em ms.
+            max_steps (int): máximo de passos por frame.
+
+        Retorna:
+            None
+        """
+        self.step = float(step)
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, dt):
+        """
+        Soma o tempo do frame e retorna quantos passos simular.
+
+        Recebe:
+            dt (float): tempo real desde o último frame (ms).
+
+        Retorna:
+            int: quantidade de passos de simulação.
+        """
+        self.accumulator += dt
+        steps = int(self.accumulator // self.step)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = self.accumulator % self.step
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        """
+        Fração do próximo passo já decorrida (0 = posição do último passo).
+
+        Retorna:
+            float
+        """
+        return min(1.0, self.accumulator / self.step)
+
+
+class Interpolator:
+    """
+    Guarda as posições do passo anterior para desenhar entre um passo e outro.
+
+    capture() é chamado antes de cada passo com os sprites que se movem (os projéteis
+    interpolam pelos próprios arrays, ver projeteis.py); position() devolve onde
+    desenhar o objeto no frame atual. Objetos que não estavam no passo anterior, ou
+    que andaram mais que SNAP_DISTANCE, são desenhados na posição atual.
+    """
+
+    def __init__(self):
+        self._prev = {}   # id(objeto) -> (objeto, x, y) no passo anterior
+        self.alpha = 1.0
+
+    def reset(self):
+        """
+        Esquece as posições anteriores (ex.: depois de teleportar o jogador).
+
+        Retorna:
+            None
+        """
+        self._prev = {}
+
+    def capture(self, items):
+        """
+        Guarda a posição atual (ponto do meio da base do rect) de cada objeto.
+
+        Recebe:
+            items (iterable): pares (objeto, pygame.Rect).
+
+        Retorna:
+            None
+        """
+        self._prev = {id(obj): (obj, rect.centerx, rect.bottom) for obj, rect in items}
+
+    def position(self, obj, rect):
+        """
+        Retorna onde desenhar o objeto neste frame.
+
+        Recebe:
+            obj: objeto passado em capture() (sprite).
+            rect (pygame.Rect): rect atual do objeto.
+
+        Retorna:
+            tuple ou pygame.Rect: canto superior esquerdo interpolado (ou o próprio rect).
+        """
+        prev = self._prev.get(id(obj))
+        if prev is None or prev[0] is not obj or self.alpha >= 1.0:
+            return rect
+        dx = rect.centerx - prev[1]
+        dy = rect.bottom - prev[2]
+        if not (dx or dy) or abs(dx) > SNAP_DISTANCE or abs(dy) > SNAP_DISTANCE:
+            return rect
+        back = 1.0 - self.alpha
+        return (round(rect.x - dx * back), round(rect.y - dy * back))